@@ -0,0 +1,33 @@
+import pytest
+
+pytest.importorskip("bpy")  # The add-on imports bpy, `pip install bpy` runs these outside Blender
+import zonohedron_blender_addon_2026 as addon
+
+from zonohedron_blender_addon_2026 import ZoneParams
+
+# Sizes where a fixed 0.001 weld merged distinct vertices of the reference build
+AGREEING = [
+    ZoneParams(sides=sides, detail=detail, zono_type='spirallohedra', rotation_clockwise=clockwise)
+    for sides, detail in ((12, 3), (46, 2), (30, 3), (25, 4), (19, 5), (16, 6), (60, 6))
+    for clockwise in (True, False)
+] + [
+    ZoneParams(sides=60, zono_type='standard'),
+    ZoneParams(sides=60, zono_type='spiral', spirals=6),
+    ZoneParams(zono_type='generators', generators=addon.GENERATOR_PRESETS['rhombic_enneacontahedron']),
+]
+
+@pytest.mark.parametrize("params", AGREEING, ids=repr)
+def test_engines_agree(params):
+    reference = addon.geometry_signature(addon.build_polygon_zonohedron(params))
+    default = addon.geometry_signature(addon.build_zonohedron(params))
+    assert addon.signature_differences(reference, default) == []
+
+@pytest.mark.parametrize("params", AGREEING + [
+    ZoneParams(sides=41, detail=3, zono_type='curved'),
+    ZoneParams(sides=60, zono_type='curved', curve_tolerance=0.001),
+], ids=repr)
+def test_estimate_matches_build(params):
+    zmesh = addon.build_zonohedron(params)
+    counts = addon.estimate_zonohedron(params)
+    assert counts["vertices"] == len(zmesh.verts)
+    assert counts["faces"] == zmesh.face_count
@@ -0,0 +1,25 @@
+from dataclasses import replace
+
+import pytest
+
+pytest.importorskip("bpy")  # The add-on imports bpy, `pip install bpy` runs these outside Blender
+import zonohedron_blender_addon_2026 as addon
+
+def test_default_engine_matches_reference(tmp_path):
+    # Every type and option of the default grid, both rotations, on a few sizes
+    path = tmp_path / "golden.jsonl"
+    params_list = list(addon.golden_grid(sides=(3, 12, 19)))
+    addon.record_golden(path, params_list)
+    assert addon.compare_golden(path) is None
+
+def test_cli_record_then_compare(tmp_path, capsys):
+    path = str(tmp_path / "golden.jsonl")
+    addon.cli_main(["--golden-record", path, "--sides-max", "6"])
+    addon.cli_main(["--golden-compare", path])
+    assert "All parameter sets match" in capsys.readouterr().out
+
+def test_compare_reports_divergence(tmp_path):
+    path = tmp_path / "golden.jsonl"
+    addon.record_golden(path, [addon.ZoneParams(sides=9)])
+    divergence = addon.compare_golden(path, engine=lambda params: addon.build_zonohedron(replace(params, width=2)))
+    assert divergence is not None and divergence[0].sides == 9
@@ -0,0 +1,109 @@
+import numpy as np
+import pytest
+
+bpy = pytest.importorskip("bpy")  # The add-on imports bpy, `pip install bpy` runs these outside Blender
+import zonohedron_blender_addon_2026 as addon
+
+from zonohedron_blender_addon_2026 import ZoneParams
+
+@pytest.fixture(scope="module", autouse=True)
+def registered():
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    addon.register()
+    yield
+    addon.unregister()
+
+def make_object(params=ZoneParams(sides=8, detail=2, zono_type='spirallohedra'), uv_scale=1.0):
+    zmesh = addon.build_zonohedron(params)
+    if uv_scale is not None:
+        addon.add_render_data(zmesh, uv_scale)
+    return addon.link_zonohedron(zmesh, params, uv_scale)
+
+def snapshot(obj):
+    # Every attribute layer but the selection, and the vertex group weights
+    layers = {}
+    for attr in obj.data.attributes:
+        if "select" in attr.name or attr.data_type not in addon.ATTRIBUTE_FIELDS:
+            continue
+        field, width, dtype = addon.ATTRIBUTE_FIELDS[attr.data_type]
+        values = np.empty(len(attr.data) * width, dtype=dtype)
+        attr.data.foreach_get(field, values)
+        layers[attr.name, attr.domain, attr.data_type] = values
+    weights = [(v.index, g.group, g.weight) for v in obj.data.vertices for g in v.groups]
+    return layers, weights
+
+def assert_same(before, after):
+    assert sorted(before[0]) == sorted(after[0])
+    for key, values in before[0].items():
+        np.testing.assert_array_equal(values, after[0][key], err_msg=str(key))
+    assert before[1] == after[1]
+
+def save_and_reload(path, regenerate=True):
+    bpy.context.scene.zonohedron_parametric = True
+    bpy.ops.wm.save_as_mainfile(filepath=str(path))
+    if not regenerate:
+        bpy.app.handlers.load_post.remove(addon.zonohedron_load_post)
+    try:
+        bpy.ops.wm.open_mainfile(filepath=str(path))
+    finally:
+        if not regenerate:
+            bpy.app.handlers.load_post.append(addon.zonohedron_load_post)
+
+@pytest.mark.parametrize("uv_scale", [None, 1.0, 2.5])
+def test_unedited_mesh_saved_as_recipe(tmp_path, uv_scale):
+    obj = make_object(uv_scale=uv_scale)
+    name = obj.name
+    assert obj in addon.proxy_objects()
+    before = snapshot(obj)
+    path = tmp_path / "proxy.blend"
+
+    save_and_reload(path, regenerate=False)
+    assert len(bpy.data.objects[name].data.vertices) == 0
+    addon.zonohedron_load_post()
+    obj = bpy.data.objects[name]
+    assert_same(before, snapshot(obj))
+    # Still a proxy, so a second save stores the recipe again
+    assert obj in addon.proxy_objects()
+    save_and_reload(path)
+    assert_same(before, snapshot(bpy.data.objects[name]))
+
+def move_uv(obj):
+    obj.data.uv_layers.active.data[0].uv = (0.25, 0.75)
+
+def mark_seam(obj):
+    obj.data.edges[0].use_seam = True
+
+def toggle_sharp_edge(obj):
+    obj.data.edges[3].use_edge_sharp = not obj.data.edges[3].use_edge_sharp
+
+def smooth_face(obj):
+    obj.data.polygons[1].use_smooth = not obj.data.polygons[1].use_smooth
+
+def weight_vertices(obj):
+    obj.vertex_groups.new(name="Weights").add([0, 1, 2], 0.5, 'REPLACE')
+
+def classify_faces(obj):
+    addon.classify_zonohedron_panels(obj, 0.001)
+
+def check_planarity(obj):
+    addon.check_planarity(obj, 1.0)
+
+def write_edge_attribute(obj):
+    forces = np.linspace(-1, 1, len(obj.data.edges), dtype=np.float32)
+    obj.data.attributes.new("axial_force", 'FLOAT', 'EDGE').data.foreach_set("value", forces)
+
+def move_vertex(obj):
+    obj.data.vertices[0].co.z += 0.01
+
+@pytest.mark.parametrize("edit", [
+    move_uv, mark_seam, toggle_sharp_edge, smooth_face, weight_vertices,
+    classify_faces, check_planarity, write_edge_attribute, move_vertex,
+])
+def test_edited_mesh_saved_whole(tmp_path, edit):
+    obj = make_object()
+    name = obj.name
+    edit(obj)
+    assert obj not in addon.proxy_objects()
+    before = snapshot(obj)
+    save_and_reload(tmp_path / "edited.blend", regenerate=False)
+    assert_same(before, snapshot(bpy.data.objects[name]))
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("bpy")  # The add-on imports bpy, `pip install bpy` runs these outside Blender
+import zonohedron_blender_addon_2026 as addon
+
+from zonohedron_blender_addon_2026 import ZoneParams
+
+def assert_same_mesh(stepped, fresh):
+    assert len(stepped.verts) == len(fresh.verts)
+    assert np.array_equal(stepped.loops, fresh.loops)
+    assert np.array_equal(stepped.offsets, fresh.offsets)
+    assert np.allclose(stepped.verts, fresh.verts, atol=1e-12)
+    for name in addon.ZONE_ATTRIBUTES:
+        assert np.array_equal(stepped.face_attributes[name], fresh.face_attributes[name])
+    assert stepped.metrics["volume"] == pytest.approx(fresh.metrics["volume"], abs=1e-12)
+    assert stepped.metrics["area"] == pytest.approx(fresh.metrics["area"], abs=1e-12)
+
+# Up to the 60 sides the update timings are quoted for, spiral counts stepping up and down
+@pytest.mark.parametrize("clockwise", (True, False))
+@pytest.mark.parametrize("sides", (3, 7, 12, 30, 41, 44, 60))
+def test_spiral_steps_match_fresh_build(sides, clockwise):
+    key = "spiral-%d-%s" % (sides, clockwise)
+    try:
+        for spirals in (1, 2, 3, 6, 4, 1, 5):
+            params = ZoneParams(sides=sides, zono_type='spiral', spirals=spirals, rotation_clockwise=clockwise)
+            assert_same_mesh(addon.refine_zonohedron(key, params), addon.build_zonohedron(params))
+    finally:
+        addon._refinements.pop(key, None)
+
+@pytest.mark.parametrize("sides", (5, 12, 60))
+def test_curved_steps_match_fresh_build(sides):
+    key = "curved-%d" % sides
+    try:
+        for detail in (1, 3, 2, 6, 4):
+            params = ZoneParams(sides=sides, detail=detail, zono_type='curved')
+            stepped = addon.refine_zonohedron(key, params)
+            fresh = addon.build_zonohedron(params)
+            assert np.allclose(stepped.verts, fresh.verts, atol=1e-12)
+            assert np.array_equal(stepped.edges, fresh.edges)
+    finally:
+        addon._refinements.pop(key, None)
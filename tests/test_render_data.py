@@ -0,0 +1,58 @@
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+pytest.importorskip("bpy")  # The add-on imports bpy, `pip install bpy` runs these outside Blender
+import zonohedron_blender_addon_2026 as addon
+
+from zonohedron_blender_addon_2026 import ZoneParams
+
+SHAPES = [
+    ZoneParams(sides=12, zono_type='standard'),
+    ZoneParams(sides=7, zono_type='standard'),
+    ZoneParams(sides=12, detail=3, zono_type='spirallohedra'),
+    ZoneParams(sides=9, detail=2, zono_type='spirallohedra'),
+    ZoneParams(sides=12, zono_type='spiral', spirals=3),
+    ZoneParams(zono_type='generators', generators=addon.GENERATOR_PRESETS['rhombic_triacontahedron']),
+]
+CASES = [
+    pytest.param(engine, replace(params, rotation_clockwise=clockwise), id="%s-%s-%s" % (engine, params.zono_type, clockwise))
+    for engine in ('default', 'reference')
+    for params in SHAPES
+    for clockwise in (True, False)
+]
+
+def test_curved_is_a_wireframe():
+    # Nothing to wind, the curved type only has edges
+    assert addon.build_zonohedron(ZoneParams(sides=8, detail=3, zono_type='curved')).face_count == 0
+
+def directed_edges(zmesh):
+    next_loop = np.arange(len(zmesh.loops)) + 1
+    next_loop[zmesh.offsets[1:] - 1] = zmesh.offsets[:-1]
+    return np.stack((zmesh.loops, zmesh.loops[next_loop]), axis=1)
+
+@pytest.mark.parametrize("engine, params", CASES)
+def test_faces_wound_outward(engine, params):
+    zmesh = addon.ENGINES[engine](params)
+    volume, _, _ = addon.face_metrics(zmesh)
+    assert volume > 0
+    # A closed mesh is consistently wound when every edge is walked once each way
+    edges = directed_edges(zmesh)
+    assert len(np.unique(edges, axis=0)) == len(edges)
+    assert len(np.unique(np.sort(edges, axis=1), axis=0)) * 2 == len(edges)
+
+@pytest.mark.parametrize("engine, params", CASES)
+def test_custom_normals_point_outward(engine, params):
+    zmesh = addon.add_render_data(addon.ENGINES[engine](params))
+    for face in range(zmesh.face_count):
+        ids = zmesh.loops[zmesh.offsets[face]:zmesh.offsets[face + 1]]
+        pts = zmesh.verts[ids]
+        winding = np.cross(pts - pts.mean(axis=0), np.roll(pts, -1, axis=0) - pts.mean(axis=0)).sum(axis=0)
+        normals = zmesh.loop_normals[zmesh.offsets[face]:zmesh.offsets[face + 1]]
+        assert np.all(normals @ winding > 0)
+    if params.zono_type in ('standard', 'spirallohedra', 'generators'):
+        # Convex shapes centred on the origin, every face looks away from it
+        centres = addon.face_centroids(zmesh)
+        first = zmesh.loop_normals[zmesh.offsets[:-1]]
+        assert np.all(np.einsum("nc,nc->n", first, centres) > 0)
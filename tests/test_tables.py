@@ -0,0 +1,31 @@
+import os
+
+import pytest
+
+pytest.importorskip("bpy")  # The add-on imports bpy, `pip install bpy` runs these outside Blender
+import zonohedron_blender_addon_2026 as addon
+
+def counting(parse, calls):
+    def wrapped(text):
+        calls.append(text)
+        return parse(text)
+    return wrapped
+
+def test_table_file_read_once_until_it_changes(tmp_path):
+    path = tmp_path / "generators.csv"
+    path.write_text("x,y,z\n1,0,0\n0,1,0\n0,0,1\n")
+    calls = []
+    parse = counting(addon.parse_generators, calls)
+    for _ in range(5):
+        assert addon.read_table(str(path), parse) == ((1, 0, 0), (0, 1, 0), (0, 0, 1))
+    assert len(calls) == 1
+
+    path.write_text("1,1,0\n0,1,1\n1,0,1\n1,1,1\n")
+    info = path.stat()
+    os.utime(path, ns=(info.st_atime_ns, info.st_mtime_ns + 1_000_000_000))
+    assert addon.read_table(str(path), parse) == ((1, 1, 0), (0, 1, 1), (1, 0, 1), (1, 1, 1))
+    assert len(calls) == 2
+
+def test_inline_table_is_parsed():
+    assert addon.read_table("1,0,0; 0,1,0; 0,0,1", addon.parse_generators) == ((1, 0, 0), (0, 1, 0), (0, 0, 1))
+    assert addon.read_table("3, 40, 2", addon.parse_sections) == {3: (40, 2)}
@@ -75,36 +75,45 @@ def cleanUpMesh():
     bpy.ops.object.mode_set(mode='OBJECT')
 
 
+# Collects every face and edge so the mesh is written once with shared vertices
+class MeshBuffer:
+    def __init__(self):
+        self.verts = []
+        self.edges = []
+        self.faces = []
+        self.index = {}
+
+    def vertIndex(self, co):
+        key = (round(co[0], 6), round(co[1], 6), round(co[2], 6))
+        if key not in self.index:
+            self.index[key] = len(self.verts)
+            self.verts.append(tuple(co))
+        return self.index[key]
+
+    def width(self):
+        xs = [v[0] for v in self.verts]
+        return max(xs) - min(xs) if xs else 0
+
+    def write(self, mesh):
+        mesh.from_pydata(self.verts, self.edges, self.faces)
+        mesh.update()
+
+
 # Draw Edge Groups
-def drawEdgeGroup(edges):
-    mesh = bpy.context.object.data
-    bm = bmesh.new()
-    bpy.ops.object.mode_set(mode='EDIT')
-    bm.from_mesh(mesh)
-    bpy.ops.object.mode_set(mode='OBJECT')
+def drawEdgeGroup(edges, buffer):
     for edge in edges:
-        v1 = bm.verts.new(edge[0])
-        v2 = bm.verts.new(edge[1])
-        bm.edges.new((v1, v2))
-    bm.to_mesh(mesh)
-    bm.free()
+        v1 = buffer.vertIndex(edge[0])
+        v2 = buffer.vertIndex(edge[1])
+        if v1 != v2:
+            buffer.edges.append((v1, v2))
 
 
 # Draw Face Groups
-def drawFaceGroup(faces):
-    mesh = bpy.context.object.data
-    bm = bmesh.new()
-    bpy.ops.object.mode_set(mode='EDIT')
-    bm.from_mesh(mesh)
-    bpy.ops.object.mode_set(mode='OBJECT')
+def drawFaceGroup(faces, buffer):
     for face in faces:
-        vert_list = []
-        for vertice in face:
-            v = bm.verts.new(vertice)
-            vert_list.append(v)
-        bm.faces.new(vert_list)
-    bm.to_mesh(mesh)
-    bm.free()
+        vert_list = [buffer.vertIndex(vertice) for vertice in face]
+        if len(set(vert_list)) == len(vert_list):
+            buffer.faces.append(vert_list)
 
 
 # Draw Helix Zonohedron
@@ -131,6 +140,7 @@ def drawZonohedron(sides, size, detail, zono_type, spirals, spiral_anticlock):
     # Create the mesh
     createMesh()
     ob = bpy.context.active_object
+    buffer = MeshBuffer()
     obj = bpy.ops.object
     # assign values to the points list
     while degrees < 360 + degree_inc:
@@ -177,9 +187,9 @@ def drawZonohedron(sides, size, detail, zono_type, spirals, spiral_anticlock):
             for k in range(0, plxlen):
                 edge_list.append([helix1[i][k], helix1[i][k + 1]])
                 edge_list.append([helix2[i][k], helix2[i][k + 1]])
-            drawEdgeGroup(edge_list)
+            drawEdgeGroup(edge_list, buffer)
         # get width of x
-        x_width = ob.dimensions[0]
+        x_width = buffer.width()
 
     # Draw standard zomes 1 for standard 2 for spiral (caps)
     if zono_type == "standard" or zono_type == "spiral":
@@ -196,10 +206,10 @@ def drawZonohedron(sides, size, detail, zono_type, spirals, spiral_anticlock):
                     v3 = moveVert(helix1[a][k + 2], x, y, z)
                     v4 = moveVert(helix1[a][k + 1], x, y, z)
                     face_list.append([v1, v2, v3, v4])
-                drawFaceGroup(face_list)
+                drawFaceGroup(face_list, buffer)
             if sz == 0:
                 base_height = v3[2]
-                x_width = ob.dimensions[0]  # get width of x
+                x_width = buffer.width()  # get width of x
 
     # Draw spiral sections
     if (zono_type == "spiral"):
@@ -221,9 +231,10 @@ def drawZonohedron(sides, size, detail, zono_type, spirals, spiral_anticlock):
                         v3 = moveVert(helix1[a][k + 2], x, y, z)
                         v4 = moveVert(helix1[a][k + 1], x, y, z)
                         face_list.append([v1, v2, v3, v4])
-                    drawFaceGroup(face_list)
+                    drawFaceGroup(face_list, buffer)
             if plxlen - 1 == sid:
                 z_adjust += base_height
+    buffer.write(ob.data)
     cleanUpMesh()
 
     # Fix scale and transform
@@ -17,8 +17,22 @@
 # ##### END GPL LICENSE BLOCK #####
 import bpy
 import bmesh
+import colorsys
 import math
-import copy
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import threading
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, astuple, dataclass, replace
+from bpy_extras.io_utils import ExportHelper, ImportHelper
+from mathutils import Matrix
 
 bl_info = {
     "name": "Add Zonohedron",
@@ -42,399 +56,2677 @@ bl_info = {
 # 7 At the bottom of the 'Create' panel you will see the Add Zonohedron panel
 
 # --- Global Declarations ---
-class zoneData:
-    sides = 12
-    width = 1
-    detail = 1
-    zono_type = 'zonohedron'
-    spirals = 1
-    rotation_clockwise = True
-
-# --- Helper functions ---
-def scale_center_clean(obj):
-    # Set the physical dimensions
-    scale = zoneData.width / obj.dimensions.x
-    obj.dimensions = (
-        zoneData.width, 
-        obj.dimensions.y * scale, 
-        obj.dimensions.z * scale
-    )
-    
-    # Set the scale after setting dimensions
-    # obj.scale = (1, 1, 1)
-
-    # Apply the Transforms object
-    bpy.ops.object.select_all(action='DESELECT') # Clear selection
-    obj.select_set(True)                         # Select our object
-    bpy.context.view_layer.objects.active = obj  # Make it the active one
-
-    # Merge Vertices
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.mesh.select_all(action='SELECT')
-    bpy.ops.mesh.remove_doubles(threshold=0.001)
-    bpy.ops.object.mode_set(mode='OBJECT')
-
-    if zoneData.rotation_clockwise:
-        bpy.ops.transform.mirror(constraint_axis=(True, False, False), orient_type='GLOBAL')
-
-    # Set the origin to the center of the object's volume/bounds
-    bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY', center='BOUNDS')
-
-    # Reset the object's location to the world center
-    obj.location = (0, 0, 0)
-
-    # Now call the operator to reset the scale/location/rotation to the data
-    bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
-
-def create_from_json_data(poly_data, object_name, mesh_name):
-    verts = []
-    faces = []
-
-    for polygon in poly_data:
-        if len(polygon) < 3:
-            continue  # At least 3 verts for a face
-
-        face_indices = []
-
-        for v in polygon:
-            verts.append((v["x"], v["y"], v["z"]))
-            face_indices.append(len(verts) - 1)
-
-        faces.append(face_indices)
-
-    mesh_data = bpy.data.meshes.new(mesh_name)
-    mesh_obj = bpy.data.objects.new(object_name, mesh_data)
-    bpy.context.collection.objects.link(mesh_obj)
-
-    mesh_data.from_pydata(verts, [], faces)
-    mesh_data.update()
-
-    scale_center_clean(mesh_obj)
-
-    return mesh_obj
+@dataclass(frozen=True)
+class ZoneParams:
+    sides: int = 12
+    width: float = 1
+    detail: int = 1
+    zono_type: str = 'standard'
+    spirals: int = 1
+    rotation_clockwise: bool = True
+    generators: tuple = ()
+    curve_tolerance: float = 0.0
+
+    @classmethod
+    def from_scene(cls, scene):
+        generators = ()
+        if scene.zonohedron_type == 'generators':
+            generators = scene_generators(scene)
+        return cls(
+            sides=scene.zonohedron_sides,
+            width=scene.zonohedron_width,
+            detail=scene.zonohedron_detail,
+            zono_type=scene.zonohedron_type,
+            spirals=scene.zonohedron_spiral,
+            rotation_clockwise=scene.zonohedron_reverse,
+            generators=generators,
+            curve_tolerance=scene.zonohedron_curve_tolerance if scene.zonohedron_adaptive else 0.0,
+        )
 
-def create_edges_from_json_data(poly_data, obj_name="EdgeObject", closed=False):
-    verts = []
-    edges = []
-    vert_index_map = {}
+ZONO_NAMES = {
+    'standard': ('Zonohedron', 'ZonohedronMesh'),
+    'spirallohedra': ('Spirallohedra', 'SpirallohedraMesh'),
+    'spiral': ('ZonohedronSpiral', 'ZonohedronSpiralMesh'),
+    'curved': ('ZonohedronCurved', 'ZonohedronCurved_mesh'),
+    'generators': ('ZonohedronGenerators', 'ZonohedronGeneratorsMesh'),
+}
 
-    def get_vert_index(v):
-        key = (v["x"], v["y"], v["z"])
-        if key not in vert_index_map:
-            vert_index_map[key] = len(verts)
-            verts.append(key)
-        return vert_index_map[key]
+PHI = (1 + math.sqrt(5)) / 2
+
+GENERATOR_PRESETS = {
+    'rhombic_dodecahedron': (
+        (1, 1, 1), (1, 1, -1), (1, -1, 1), (-1, 1, 1),
+    ),
+    'truncated_octahedron': (
+        (1, 1, 0), (1, -1, 0), (1, 0, 1), (1, 0, -1), (0, 1, 1), (0, 1, -1),
+    ),
+    'rhombic_triacontahedron': (
+        (0, 1, PHI), (0, -1, PHI), (1, PHI, 0), (-1, PHI, 0), (PHI, 0, 1), (-PHI, 0, 1),
+    ),
+    'rhombic_enneacontahedron': (
+        (1, 1, 1), (1, 1, -1), (1, -1, 1), (-1, 1, 1),
+        (0, 1 / PHI, PHI), (0, -1 / PHI, PHI), (1 / PHI, PHI, 0),
+        (-1 / PHI, PHI, 0), (PHI, 0, 1 / PHI), (-PHI, 0, 1 / PHI),
+    ),
+}
 
-    for loop in poly_data:
-        if len(loop) < 2:
+def parse_generators(text):
+    # One x,y,z vector per line or separated by semicolons, '#' starts a comment
+    generators = []
+    for line in text.replace(";", "\n").splitlines():
+        line = line.split("#")[0].strip()
+        if not line:
             continue
+        try:
+            values = [float(v) for v in line.replace(",", " ").split()]
+        except ValueError:
+            continue  # Header row
+        if len(values) == 3:
+            generators.append(tuple(values))
+    return tuple(generators)
+
+TABLE_FILES = {}  # Parsed table files by path, with the mtime and size they were read at
+
+def read_table(text, parse):
+    # The field holds the table itself or the path of a file with it. The panel redraws
+    # often, so files are only read again once they change
+    path = bpy.path.abspath(text)
+    if not os.path.isfile(path):
+        return parse(text)
+    info = os.stat(path)
+    key = (parse, info.st_mtime_ns, info.st_size)
+    cached = TABLE_FILES.get(path)
+    if cached is None or cached[0] != key:
+        with open(path) as f:
+            cached = TABLE_FILES[path] = (key, parse(f.read()))
+    return cached[1]
+
+def scene_generators(scene):
+    if scene.zonohedron_generator_preset != 'custom':
+        return GENERATOR_PRESETS[scene.zonohedron_generator_preset]
+    return read_table(scene.zonohedron_generator_text, parse_generators)
+
+class ZoneMesh:
+    # Flat geometry buffers: faces are loops split by offsets, wireframes use edges
+    def __init__(self, verts, loops=None, offsets=None, edges=None, generators=None):
+        self.generators = generators
+        self.metrics = None
+        self.uvs = None
+        self.loop_normals = None
+        self.face_attributes = {}
+        self.verts = np.asarray(verts, dtype=np.float64).reshape(-1, 3)
+        self.loops = np.zeros(0, dtype=np.int64) if loops is None else np.asarray(loops, dtype=np.int64)
+        self.offsets = np.zeros(1, dtype=np.int64) if offsets is None else np.asarray(offsets, dtype=np.int64)
+        self.edges = np.zeros((0, 2), dtype=np.int64) if edges is None else np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+
+    @property
+    def face_count(self):
+        return len(self.offsets) - 1
+
+    @property
+    def loop_total(self):
+        return np.diff(self.offsets)
+
+    def face_index(self):
+        # Face number of every loop
+        return np.repeat(np.arange(self.face_count), self.loop_total)
+
+class PolygonStore:
+    # Ragged point lists in one flat (n, 3) array, polygon i is coords[offsets[i]:offsets[i + 1]].
+    # attributes holds one integer per polygon, like the zone it came from
+    def __init__(self, coords, offsets, attributes=None):
+        self.coords = np.asarray(coords, dtype=np.float64).reshape(-1, 3)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.attributes = attributes or {}
+
+    @classmethod
+    def from_array(cls, polygons, **attributes):
+        # (count, n, 3) stack of polygons with the same number of points
+        polygons = np.asarray(polygons, dtype=np.float64)
+        store = cls(polygons.reshape(-1, 3), np.arange(len(polygons) + 1) * polygons.shape[1])
+        for name, values in attributes.items():
+            store = store.label(name, values)
+        return store
+
+    @classmethod
+    def concat(cls, stores):
+        coords = np.concatenate([store.coords for store in stores])
+        sizes = np.concatenate([np.diff(store.offsets) for store in stores])
+        names = {name for store in stores for name in store.attributes}
+        attributes = {
+            name: np.concatenate([store.attributes.get(name, np.zeros(len(store), dtype=np.int64)) for store in stores])
+            for name in names
+        }
+        return cls(coords, np.concatenate(([0], np.cumsum(sizes))), attributes)
+
+    def label(self, name, values):
+        # Same polygons with attribute name set to values, a scalar or one per polygon
+        values = np.broadcast_to(np.asarray(values, dtype=np.int64), (len(self),)).copy()
+        return PolygonStore(self.coords, self.offsets, dict(self.attributes, **{name: values}))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        return self.coords[self.offsets[index]:self.offsets[index + 1]]
+
+    def slice(self, start, stop):
+        # Polygons start to stop, sharing this store's coordinates
+        return PolygonStore(
+            self.coords[self.offsets[start]:self.offsets[stop]],
+            self.offsets[start:stop + 1] - self.offsets[start],
+            {name: values[start:stop] for name, values in self.attributes.items()}
+        )
 
-        indices = [get_vert_index(v) for v in loop]
-
-        for i in range(len(indices) - 1):
-            edges.append((indices[i], indices[i + 1]))
-
-        if closed:
-            edges.append((indices[-1], indices[0]))
-
-    mesh = bpy.data.meshes.new(obj_name + "_mesh")
-    mesh.from_pydata(verts, edges, [])
-    mesh.update()
-
-    obj = bpy.data.objects.new(obj_name, mesh)
-    bpy.context.collection.objects.link(obj)
-    scale_center_clean(obj)
-
-    return obj
-
-def calculate_distance(p1, p2):
-    dx = p1["x"] - p2["x"]
-    dy = p1["y"] - p2["y"]
-    return math.sqrt(dx*dx + dy*dy)
-
-def line_angle(p1, p2):
-    dx = p2["x"] - p1["x"]
-    dy = p2["y"] - p1["y"]
-    deg = math.degrees(math.atan2(dy, dx))
-    return deg + 360 if deg < 0 else deg
+    def copies(self, coords, index=None, start=0):
+        # Offsets for len(coords) back to back copies of these polygons, numbering the copies in attribute index
+        sizes = np.tile(np.diff(self.offsets), len(coords))
+        attributes = {name: np.tile(values, len(coords)) for name, values in self.attributes.items()}
+        if index is not None:
+            attributes[index] = np.repeat(np.arange(start, start + len(coords)), len(self))
+        return PolygonStore(coords.reshape(-1, 3), np.concatenate(([0], np.cumsum(sizes))), attributes)
+
+    def transform(self, matrices, center=(0, 0, 0), delta=(0, 0, 0), index=None, start=0):
+        # One copy per matrix and delta, turned about center then moved by delta, written in one pass
+        center = np.asarray(center, dtype=np.float64)
+        matrices = np.asarray(matrices, dtype=np.float64).reshape(-1, 3, 3)
+        delta = np.asarray(delta, dtype=np.float64).reshape(-1, 3)
+        matrices = np.broadcast_to(matrices, (max(len(matrices), len(delta)), 3, 3))
+        coords = np.einsum("kij,nj->kni", matrices, self.coords - center) + (center + delta)[:, None]
+        return self.copies(coords, index, start)
+
+    def rotate(self, degrees, center=(0, 0, 0), index=None, start=0):
+        # About the z axis through center, one copy per angle
+        return self.transform(rotation_z(degrees), center, index=index, start=start)
+
+    def translate(self, delta, index=None, start=0):
+        # One copy per row of delta
+        delta = np.asarray(delta, dtype=np.float64).reshape(-1, 3)
+        return self.copies(self.coords[None] + delta[:, None], index, start)
+
+# Integer face attributes recording where each face came from
+ZONE_ATTRIBUTES = ("zone_arm", "zone_band", "zone_segment")
+
+# Every engine welds points closer than this fraction of the width. Coincident points only differ
+# by rounding, while distinct vertices of the largest solids are under 0.001 apart. With it both
+# engines agree over the whole golden grid, 3 to 60 sides with up to 6 details or spirals
+WELD_TOLERANCE = 1e-7
+
+class GenerationCancelled(Exception):
+    pass
 
-def rotate_point(center, point, degrees):
-    length = calculate_distance(center, point)
-    angle = line_angle(center, point)
-    rad = math.radians(degrees + angle)
+# --- Helper functions ---
+def no_progress(fraction):
+    pass
+
+def polygons_to_mesh(polygons):
+    sizes = np.diff(polygons.offsets)
+    keep = sizes >= 3  # At least 3 verts for a face
+    verts = polygons.coords[np.repeat(keep, sizes)]
+    offsets = np.concatenate(([0], np.cumsum(sizes[keep])))
+    zmesh = ZoneMesh(verts, np.arange(len(verts)), offsets)
+    zmesh.face_attributes = {name: values[keep] for name, values in polygons.attributes.items()}
+    return zmesh
+
+def lines_to_mesh(lines, closed=False):
+    sizes = np.diff(lines.offsets)
+    keep = sizes >= 2
+    verts = lines.coords[np.repeat(keep, sizes)]
+    ends = np.cumsum(sizes[keep])
+    # Join every point to the next one on its line
+    inner = np.ones(len(verts), dtype=bool)
+    inner[ends - 1] = False
+    starts = np.nonzero(inner)[0]
+    edges = np.stack((starts, starts + 1), axis=1)
+    if closed:
+        edges = np.concatenate((edges, np.stack((ends - 1, ends - sizes[keep]), axis=1)))
+    return ZoneMesh(verts, edges=edges)
+
+def weld_mesh(zmesh, threshold):
+    # Merge vertices that share a threshold sized cell, like Merge by Distance.
+    # The grid is shifted off round numbers so symmetric coordinates don't land on cell borders,
+    # and a second grid offset by half a cell catches pairs split by a border in the first
+    verts = zmesh.verts
+    inverse = np.arange(len(verts))
+    for offset in (0.3183, 0.8183):
+        keys = np.rint(verts / threshold + offset).astype(np.int64)
+        _, first, cells = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+        inverse = cells.ravel()[inverse]
+        verts = verts[first]
+
+    # Drop loops collapsed onto their neighbour and faces left with fewer than 3 corners
+    loops = inverse[zmesh.loops]
+    face = zmesh.face_index()
+    next_loop = np.arange(len(loops)) + 1
+    next_loop[zmesh.offsets[1:] - 1] = zmesh.offsets[:-1]
+    keep = loops != loops[next_loop] if len(loops) else np.zeros(0, dtype=bool)
+    totals = np.bincount(face[keep], minlength=zmesh.face_count)
+    keep &= totals[face] >= 3
+    loops, face = loops[keep], face[keep]
+    faces = np.nonzero(totals >= 3)[0]
+    totals = totals[faces]
+    offsets = np.concatenate(([0], np.cumsum(totals)))
+
+    # Drop doubled faces
+    if len(totals):
+        keep_face = np.ones(len(totals), dtype=bool)
+        for n in np.unique(totals):
+            idx = np.nonzero(totals == n)[0]
+            corners = np.sort(loops[offsets[idx][:, None] + np.arange(n)], axis=1)
+            _, unique = np.unique(corners, axis=0, return_index=True)
+            doubled = np.ones(len(idx), dtype=bool)
+            doubled[unique] = False
+            keep_face[idx[doubled]] = False
+        keep = np.repeat(keep_face, totals)
+        loops = loops[keep]
+        totals = totals[keep_face]
+        faces = faces[keep_face]
+        offsets = np.concatenate(([0], np.cumsum(totals)))
+
+    edges = inverse[zmesh.edges]
+    edges = np.sort(edges[edges[:, 0] != edges[:, 1]], axis=1)
+    edges = np.unique(edges, axis=0) if len(edges) else edges
+    welded = ZoneMesh(verts, loops, offsets, edges)
+    welded.face_attributes = {name: values[faces] for name, values in zmesh.face_attributes.items()}
+    return welded
+
+def mirror_mesh(zmesh):
+    verts = zmesh.verts * (-1, 1, 1)
+    # Reverse the winding so the normals still point outward
+    starts = np.repeat(zmesh.offsets[:-1], zmesh.loop_total)
+    ends = np.repeat(zmesh.offsets[1:], zmesh.loop_total)
+    loops = zmesh.loops[starts + ends - 1 - np.arange(len(zmesh.loops))]
+    mirrored = ZoneMesh(verts, loops, zmesh.offsets, zmesh.edges)
+    mirrored.face_attributes = dict(zmesh.face_attributes)
+    return mirrored
+
+def finalize_mesh(zmesh, params, weld=True):
+    # Set the physical dimensions
+    low, high = zmesh.verts.min(axis=0), zmesh.verts.max(axis=0)
+    scale = params.width / (high[0] - low[0])
+    zmesh.verts *= scale
+    generators = None if zmesh.generators is None else zmesh.generators * scale
 
+    # Merge Vertices
+    if weld:
+        zmesh = weld_mesh(zmesh, WELD_TOLERANCE * params.width)
+
+    if params.rotation_clockwise:
+        zmesh = mirror_mesh(zmesh)
+
+    # Center the bounds on the world origin
+    low, high = zmesh.verts.min(axis=0), zmesh.verts.max(axis=0)
+    zmesh.verts -= (low + high) / 2
+    zmesh.generators = generators
+    return zmesh
+
+# --- Metrics ---
+def generator_metrics(generators):
+    # Zonotope of segments: volume sums |det| over generator triples, area 2|cross| over pairs
+    volume = 0.0
+    area = 0.0
+    for i in range(len(generators) - 1):
+        rest = generators[i + 1:]
+        cross = np.cross(generators[i], rest)
+        area += 2 * np.linalg.norm(cross, axis=1).sum()
+        volume += np.abs(cross @ rest.T).sum() / 2
+    return volume, area
+
+def face_metrics(zmesh):
+    # Fan triangles from the first corner of every face, degenerate ones add nothing.
+    # Signed volume, summed doubled triangle normals and area
+    first = np.repeat(zmesh.offsets[:-1], zmesh.loop_total)
+    next_loop = np.arange(len(zmesh.loops)) + 1
+    next_loop[zmesh.offsets[1:] - 1] = zmesh.offsets[:-1]
+    a = zmesh.verts[zmesh.loops[first]]
+    b = zmesh.verts[zmesh.loops]
+    c = zmesh.verts[zmesh.loops[next_loop]]
+    cross = np.cross(b - a, c - a)
+    area = np.linalg.norm(cross, axis=1).sum() / 2
+    volume = np.einsum("nc,nc->n", a, np.cross(b, c)).sum() / 6
+    return volume, cross.sum(axis=0), area
+
+def mesh_metrics(zmesh):
+    volume, _, area = face_metrics(zmesh)
+    return abs(volume), area
+
+def zone_metrics(zmesh):
+    if zmesh.generators is not None:
+        volume, area = generator_metrics(zmesh.generators)
+    else:
+        volume, area = mesh_metrics(zmesh)
+    low, high = zmesh.verts.min(axis=0), zmesh.verts.max(axis=0)
+    edge_length = np.linalg.norm(zmesh.verts[zmesh.edges[:, 0]] - zmesh.verts[zmesh.edges[:, 1]], axis=1).sum()
     return {
-        "x": center["x"] + math.cos(rad) * length,
-        "y": center["y"] + math.sin(rad) * length,
-        "z": point["z"]
+        "volume": float(volume),
+        "area": float(area),
+        "dimensions": tuple(float(d) for d in high - low),
+        "radius": float(np.linalg.norm(zmesh.verts, axis=1).max()),
+        "edge_length": float(edge_length),
     }
 
-def rotate_point_list(points, rotation, center):
-    return [rotate_point(center, p, rotation) for p in points]
-
-def move_point_list(points, snap_target, snap_hook, segments):
-    pts = copy.deepcopy(points)
-    segments = min(len(pts), segments + 1)
-    dx = snap_hook["x"] - snap_target["x"]
-    dy = snap_hook["y"] - snap_target["y"]
-    dz = snap_hook["z"] - snap_target["z"]
-    moved = []
-    for i in range(segments):
-        p = pts[i]
-        moved.append({
-            "x": p["x"] - dx,
-            "y": p["y"] - dy,
-            "z": p["z"] - dz
-        })
-    return moved
-
-def rotate_point_xyz(center, point, degrees):
-    rx = math.radians(degrees["x"])
-    ry = math.radians(degrees["y"])
-    rz = math.radians(degrees["z"])
-
-    # translate to origin
-    px = point["x"] - center["x"]
-    py = point["y"] - center["y"]
-    pz = point["z"] - center["z"]
-
-    # rotate X
-    x1 = px
-    y1 = py * math.cos(rx) - pz * math.sin(rx)
-    z1 = py * math.sin(rx) + pz * math.cos(rx)
-
-    # rotate Y
-    x2 = x1 * math.cos(ry) + z1 * math.sin(ry)
-    y2 = y1
-    z2 = -x1 * math.sin(ry) + z1 * math.cos(ry)
-
-    # rotate Z
-    x3 = x2 * math.cos(rz) - y2 * math.sin(rz)
-    y3 = x2 * math.sin(rz) + y2 * math.cos(rz)
-    z3 = z2
-
-    return {
-        "x": x3 + center["x"],
-        "y": y3 + center["y"],
-        "z": z3 + center["z"],
-    }
+def fill_mesh_buffers(mesh, verts, loops, offsets, edges=()):
+    # float32 verts and int32 indices go to Blender without a copy
+    mesh.vertices.add(len(verts))
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(verts, dtype=np.float32).ravel())
+    if len(edges):
+        mesh.edges.add(len(edges))
+        mesh.edges.foreach_set("vertices", np.ascontiguousarray(edges, dtype=np.int32).ravel())
+    if len(offsets) > 1:
+        mesh.loops.add(len(loops))
+        mesh.loops.foreach_set("vertex_index", np.ascontiguousarray(loops, dtype=np.int32))
+        mesh.polygons.add(len(offsets) - 1)
+        mesh.polygons.foreach_set("loop_start", np.ascontiguousarray(offsets[:-1], dtype=np.int32))
+        if bpy.app.version < (4, 0, 0):
+            mesh.polygons.foreach_set("loop_total", np.diff(offsets).astype(np.int32))
+    mesh.update(calc_edges=True)
+
+def fill_mesh(mesh, zmesh):
+    fill_mesh_buffers(mesh, zmesh.verts, zmesh.loops, zmesh.offsets, zmesh.edges)
+
+    for name, values in zmesh.face_attributes.items():
+        set_face_attribute(mesh, name, values, 'INT' if values.dtype.kind in "iu" else 'FLOAT')
+
+    if zmesh.uvs is not None and zmesh.face_count:
+        uv_layer = mesh.uv_layers.new(name="UVMap")
+        uv_layer.data.foreach_set("uv", zmesh.uvs.astype(np.float32).ravel())
+    if zmesh.loop_normals is not None and zmesh.face_count:
+        if bpy.app.version < (4, 1, 0):
+            mesh.use_auto_smooth = True
+        mesh.normals_split_custom_set(zmesh.loop_normals.astype(np.float32))
+
+def link_zone_mesh(zmesh, object_name, mesh_name, collection=None, params=None, uv_scale=None):
+    mesh = bpy.data.meshes.new(mesh_name)
+    fill_mesh(mesh, zmesh)
+
+    obj = bpy.data.objects.new(object_name, mesh)
+    (collection or bpy.context.collection).objects.link(obj)
+    write_zone_properties(obj, zmesh, params, uv_scale)
+    return obj
 
-def create_spiral(height, radius, center, num_of_points, clockwise = True):
-    if zoneData.zono_type == 'curved' or zoneData.zono_type == 'spirallohedra':
-        height_offset = height / (zoneData.sides * zoneData.detail) 
+def write_zone_properties(obj, zmesh, params=None, uv_scale=None):
+    for key, value in (zmesh.metrics or {}).items():
+        obj["zonohedron_" + key] = value
+    if params is not None:
+        recipe = params_to_recipe(params)
+        # Render data is rebuilt with the mesh when a proxy is loaded
+        recipe["render_ready"] = uv_scale is not None
+        recipe["uv_scale"] = 1.0 if uv_scale is None else uv_scale
+        recipe["fingerprint"] = mesh_fingerprint(obj.data)
+        obj["zonohedron_recipe"] = recipe
+
+def rotation_z(degrees):
+    # One matrix per angle, turning about the z axis
+    rad = np.radians(np.asarray(degrees, dtype=np.float64))
+    matrix = np.zeros(rad.shape + (3, 3))
+    matrix[..., 0, 0] = np.cos(rad)
+    matrix[..., 0, 1] = -np.sin(rad)
+    matrix[..., 1, 0] = np.sin(rad)
+    matrix[..., 1, 1] = np.cos(rad)
+    matrix[..., 2, 2] = 1
+    return matrix
+
+def rotation_xyz(x, y, z):
+    # Rotate about X, then Y, then Z
+    rx, ry, rz = np.radians((x, y, z))
+    matrix_x = np.array([[1, 0, 0], [0, math.cos(rx), -math.sin(rx)], [0, math.sin(rx), math.cos(rx)]])
+    matrix_y = np.array([[math.cos(ry), 0, math.sin(ry)], [0, 1, 0], [-math.sin(ry), 0, math.cos(ry)]])
+    return rotation_z(z) @ matrix_y @ matrix_x
+
+def rotate_points(points, degrees, center=(0, 0, 0)):
+    center = np.asarray(center, dtype=np.float64)
+    return (points - center) @ rotation_z(degrees).T + center
+
+def create_spiral(params, height, radius, center, num_of_points, clockwise = True, steps=None):
+    if params.zono_type == 'curved' or params.zono_type == 'spirallohedra':
+        height_offset = height / (params.sides * params.detail)
     else:
-        height_offset = height / zoneData.sides    
-    half_circle_center = {"x": center["x"] + radius, "y": center["y"], "z": 0}
-    degrees = 360/num_of_points    
-    spiral_arm = []
-    point = {
-        "x": center["x"] + radius * 2,
-        "y": center["y"],
-        "z": 0
-    }
-    
-    for i in range(num_of_points + 1):
-        if clockwise:
-            rot = 180 + i * degrees
-        else:
-            rot = 180 - i * degrees
-        spiral_arm.append(
-            rotate_point_xyz(half_circle_center, point, {"x": 0, "y": 0, "z": rot})
-        )
-        point = dict(point)
-        point["z"] += height_offset
-    return spiral_arm    
+        height_offset = height / params.sides
+    # Half circle around center + radius, climbing height_offset per point; steps picks a subset of the points
+    if steps is None:
+        steps = np.arange(num_of_points + 1)
+    rot = np.radians(180 + (1 if clockwise else -1) * steps * (360 / num_of_points))
+    return np.stack((
+        center[0] + radius + np.cos(rot) * radius,
+        center[1] + np.sin(rot) * radius,
+        steps * height_offset,
+    ), axis=1)
 
 # --- Core render functions ---
-def create_zonohedron():
-    zone_sides = zoneData.sides * zoneData.detail
-    center = {"x": 0, "y": 0, "z": 0}
-    radius = zoneData.width/2
+def create_zonohedron(params, progress=no_progress):
+    zone_sides = params.sides * params.detail
+    center = (0, 0, 0)
+    radius = params.width/2
     height = radius * 5
-    height_offset = height / zone_sides
-    deg = 360 / zone_sides
-    arms_deg = 360 / zoneData.sides
-    ribs = []
-    leaf_polygons = []
-    all_polygons = []
-
-    first_spiral_arm = create_spiral(height, radius, center, zone_sides, True)
-    second_spiral_arm = rotate_point_list(first_spiral_arm, arms_deg, center)
-
-    # --- Ribs ---
-    for i in range(zone_sides - (zoneData.detail - 1)):
-        rib = move_point_list(
-            first_spiral_arm,
-            second_spiral_arm[i],
-            first_spiral_arm[0],
-            zoneData.detail
-        )
-        ribs.append(rib)
+    arms_deg = 360 / params.sides
+
+    first_spiral_arm = create_spiral(params, height, radius, center, zone_sides, True)
+    second_spiral_arm = rotate_points(first_spiral_arm, arms_deg, center)
+
+    # --- Ribs: the start of the first arm snapped onto each point of the second ---
+    rib_count = zone_sides - (params.detail - 1)
+    ribs = first_spiral_arm[:params.detail + 1] + (second_spiral_arm[:rib_count] - first_spiral_arm[0])[:, None]
+    progress(0.5)
 
     # --- Leaf polygons ---
-    for i in range(len(ribs) - 1):
-        rib = ribs[i]
-        rib_next = ribs[i + 1]
-
-        for j in range(len(rib) - 1):
-            polygon = [
-                rib[j],
-                rib[j + 1],
-                rib_next[j + 1],
-                rib_next[j]
-            ]
-            leaf_polygons.append(polygon)
+    band, segment = np.meshgrid(np.arange(rib_count - 1), np.arange(params.detail), indexing="ij")
+    # Wound counter clockwise seen from outside
+    leaf_polygons = PolygonStore.from_array(np.stack((
+        ribs[:-1, :-1],
+        ribs[1:, :-1],
+        ribs[1:, 1:],
+        ribs[:-1, 1:],
+    ), axis=2).reshape(-1, 4, 3), zone_band=band.ravel(), zone_segment=segment.ravel())
 
     # --- Replicate around arms ---
-    for i in range(zoneData.sides):
-        rotation = i * arms_deg + 180
-        for poly in leaf_polygons:
-            all_polygons.append(
-                rotate_point_list(poly, rotation, center)
-            )
+    return leaf_polygons.rotate(np.arange(params.sides) * arms_deg + 180, center, index="zone_arm")
 
-    return all_polygons
-
-def create_spiral_zonohedron():
-    zone_sides = zoneData.sides
-    center = {"x": 0, "y": 0, "z": 0}
-    radius = zoneData.width/2
-    height = radius * 4 
-    height_offset = height / zone_sides
+def spiral_zonohedron_pieces(params, progress=no_progress):
+    # Top shell, one spiral case and the bottom shell of a single spiral, plus the height of a case
+    zone_sides = params.sides
+    center = (0, 0, 0)
+    radius = params.width/2
+    height = radius * 4
     deg = 360 / zone_sides
-    half_circle_center = {"x": center["x"] + radius, "y": center["y"], "z": center["z"]}
-    single_leaf_polygons = []
-    double_leaf_polygons = []
-    top_shell = []
-    spiral_case = []
-    bottom_shell = []
-    first_spiral_arm = create_spiral(height, radius, center, zone_sides, True)
-    base_spiral_arm = create_spiral(height, radius, center, zone_sides, False)
+    first_spiral_arm = create_spiral(params, height, radius, center, zone_sides, True)
+    base_spiral_arm = create_spiral(params, height, radius, center, zone_sides, False)
 
     # ---- Rotate base spiral arm ----
-    base_spiral_arm = rotate_point_list(base_spiral_arm, (zone_sides / 2) * -deg, center)
+    base_spiral_arm = rotate_points(base_spiral_arm, (zone_sides / 2) * -deg, center)
     # ---- Second spiral arm ----
-    second_spiral_arm = rotate_point_list(
-        first_spiral_arm,
-        deg,
-        first_spiral_arm[0]
-    )
+    second_spiral_arm = rotate_points(first_spiral_arm, deg, first_spiral_arm[0])
     # ---- Single leaf ----
-    for i in range(len(first_spiral_arm) - 2):
-        poly = [
-            second_spiral_arm[i],
-            second_spiral_arm[i + 1],
-            first_spiral_arm[i + 2],
-            first_spiral_arm[i + 1]
-        ]
-        single_leaf_polygons.append(poly)
+    single_leaf_polygons = PolygonStore.from_array(np.stack((
+        second_spiral_arm[:-2],
+        second_spiral_arm[1:-1],
+        first_spiral_arm[2:],
+        first_spiral_arm[1:-1],
+    ), axis=1), zone_band=np.arange(zone_sides - 1))
 
     # ---- Top shell and seed double leaves ----
-    count = zone_sides
-    for i in range(zone_sides):
-        for idx, poly in enumerate(single_leaf_polygons):
-            rotated = rotate_point_list(poly, i * deg, center)
-            if i == zone_sides - 1:
-                double_leaf_polygons.append(rotated)
-            else:
-                if idx < count - 1:
-                    top_shell.append(rotated)
-        count -= 1
+    # Row i keeps its first zone_sides - i - 1 leaves, the last row seeds the double leaves
+    leaf_count = len(single_leaf_polygons)
+    rows = single_leaf_polygons.rotate(np.arange(zone_sides) * deg, center, index="zone_arm")
+    top_shell = PolygonStore.concat([
+        rows.slice(i * leaf_count, i * leaf_count + zone_sides - i - 1) for i in range(zone_sides - 1)
+    ])
+    double_leaf_polygons = rows.slice((zone_sides - 1) * leaf_count, zone_sides * leaf_count)
 
     # ---- Extend double leaf ----
-    seed = double_leaf_polygons[0][0]
-    for poly in list(double_leaf_polygons):
-        ext = move_point_list(
-            poly,
-            base_spiral_arm[1],
-            seed,
-            zone_sides
-        )
-        double_leaf_polygons.append(ext)
+    seed = double_leaf_polygons[0][0].copy()
+    double_leaf_polygons = PolygonStore.concat((
+        double_leaf_polygons,
+        double_leaf_polygons.translate(base_spiral_arm[1] - seed),
+    ))
+    double_leaf_polygons = double_leaf_polygons.label("zone_band", np.arange(len(double_leaf_polygons)))
+    progress(0.25)
 
     # ---- Spiral case ----
-    for i in range(zone_sides - 1):
-        for poly in double_leaf_polygons:
-            rotated = rotate_point_list(poly, (i + 1) * -deg, center)
-            moved = move_point_list(
-                rotated,
-                base_spiral_arm[i + 1],
-                seed,
-                zone_sides
-            )
-            spiral_case.append(moved)
+    steps = np.arange(1, zone_sides)
+    spiral_case = double_leaf_polygons.transform(
+        rotation_z(steps * -deg),
+        center,
+        base_spiral_arm[steps] - seed,
+        index="zone_arm",
+        start=1
+    )
+    spiral_case_complete = PolygonStore.concat((double_leaf_polygons.label("zone_arm", 0), spiral_case))
+    progress(0.5)
 
-    spiral_case_complete = double_leaf_polygons + spiral_case
+    # ---- Bottom shell ----
+    # The top shell turned over about the end of the base arm
+    bottom_shell = top_shell.transform(rotation_xyz(0, 180, 180), base_spiral_arm[-1])
 
-    # ---- Spiral repetitions ----
-    spiral_extensions = []
-    for i in range(1, zoneData.spirals):
-        for poly in spiral_case_complete:
-            spiral_extensions.append(
-                move_point_list(
-                    poly,
-                    {"x": 0, "y": 0, "z": height * i},
-                    {"x": 0, "y": 0, "z": 0},
-                    zone_sides
-                )
-            )
+    return top_shell, spiral_case_complete, bottom_shell, height
 
-    # ---- Bottom shell ----
-    for poly in top_shell:
-        new_poly = []
-        for p in poly:
-            rp = rotate_point_xyz(
-                base_spiral_arm[-1],
-                p,
-                {"x": 0, "y": 180, "z": 180}
-            )
-            if zoneData.spirals > 1:
-                rp["z"] += height * (zoneData.spirals - 1)
-            new_poly.append(rp)
-        bottom_shell.append(new_poly)
+def create_spiral_zonohedron(params, progress=no_progress):
+    top_shell, spiral_case_complete, bottom_shell, height = spiral_zonohedron_pieces(params, progress)
 
-    all_polygons = (
-        top_shell +
-        spiral_case_complete +
-        spiral_extensions +
-        bottom_shell
+    # ---- Spiral repetitions ----
+    # Segments count up from the top shell: 0 top, one per spiral, spirals + 1 bottom
+    spiral_extensions = spiral_case_complete.translate(
+        np.arange(1, params.spirals)[:, None] * (0, 0, height),
+        index="zone_segment",
+        start=2
+    )
+    progress(0.75)
+
+    # ---- Bottom shell lowered past the extra spirals ----
+    bottom_shell = bottom_shell.translate((0, 0, height * (params.spirals - 1)))
+
+    return PolygonStore.concat((
+        top_shell.label("zone_segment", 0),
+        spiral_case_complete.label("zone_segment", 1),
+        spiral_extensions,
+        bottom_shell.label("zone_segment", params.spirals + 1),
+    ))
+
+def adaptive_steps(params, height, radius, max_split=32):
+    # Arm positions, in steps of sides points per arm, where the chords stay within curve_tolerance.
+    # Knots sit where clockwise and counter clockwise arms cross, at half a turn plus whole sides,
+    # and every knot interval is split into the fewest equal pieces that meet the tolerance
+    knot_step = 0.5 if params.sides % 2 else 1
+    knots = np.arange(0, params.sides + knot_step / 2, knot_step)
+
+    def arm(steps, clockwise=True):
+        return create_spiral(params, height, radius, (0, 0, 0), params.sides, clockwise, steps)
+
+    # The tolerance is in finished units, the wireframe is scaled to params.width afterwards
+    ends = np.concatenate((arm(knots), arm(knots, False)))
+    x = np.einsum("kc,nc->kn", rotation_z(np.arange(params.sides + 1) * (360 / params.sides))[:, 0], ends)
+    scale = params.width / (x.max() - x.min())
+
+    # Chord deviation of the first piece of every knot interval for every split count at once
+    split = np.arange(1, max_split + 1)[:, None]
+    start = np.broadcast_to(knots[:-1], (max_split, len(knots) - 1)).ravel()
+    piece = np.broadcast_to(knot_step / split, (max_split, len(knots) - 1)).ravel()
+    a, b, mid = arm(start), arm(start + piece), arm(start + piece / 2)
+    chord = b - a
+    deviation = np.linalg.norm(np.cross(mid - a, chord), axis=1) / np.linalg.norm(chord, axis=1)
+    deviation = deviation.reshape(max_split, -1).max(axis=1) * scale
+    fine = np.nonzero(deviation <= params.curve_tolerance)[0]
+    count = fine[0] + 1 if len(fine) else max_split
+
+    steps = knots[:-1, None] + knot_step * np.arange(count) / count
+    return np.append(steps.ravel(), knots[-1])
+
+def curved_arms(params):
+    # Clockwise and counter clockwise base arm, sampled evenly by detail or adaptively by tolerance
+    radius = params.width/2
+    height = radius * 4
+    num_of_points = params.sides * params.detail
+    steps = adaptive_steps(params, height, radius) if params.curve_tolerance else None
+    return np.stack([
+        create_spiral(params, height, radius, (0, 0, 0), num_of_points, clockwise, steps)
+        for clockwise in (True, False)
+    ])
+
+def create_curved_zonohedron(params, progress=no_progress):
+    center = (0, 0, 0)
+    degrees = 360/params.sides
+    arms = PolygonStore.from_array(curved_arms(params))
+    return arms.rotate(np.arange(params.sides + 1) * degrees, center)
+
+def create_generator_zonohedron(params, progress=no_progress):
+    # Reference for generator sets in general position: every pair of generators spans
+    # two opposite faces, pushed out by the other generators on either side of their plane
+    generators = merge_generators(params.generators)
+    count = len(generators)
+    polygons = []
+    arm, band = [], []
+    for i in range(count):
+        progress(i / count)
+        for j in range(i + 1, count):
+            normal = np.cross(generators[i], generators[j])
+            side = np.sign(generators @ normal)
+            side[[i, j]] = 0
+            if np.count_nonzero(side) != count - 2:
+                raise ValueError("Reference faces need no three generators in one plane")
+            a, b = generators[i] / 2, generators[j] / 2
+            corners = side @ generators / 2 + np.array((-a - b, a - b, a + b, b - a))
+            polygons += [corners, -corners[::-1]]
+            arm += [i, i]
+            band += [j, j]
+    return PolygonStore.from_array(np.reshape(polygons, (-1, 4, 3)), zone_arm=arm, zone_band=band)
+
+# --- Generator vector engine ---
+def zonohedron_generators(params):
+    # Chords of the spiral arm: every one is the previous rotated by 360 / zone_sides
+    zone_sides = params.sides * params.detail
+    radius = params.width / 2
+    height = radius * 5
+    theta = np.radians(np.arange(zone_sides + 1) * (360 / zone_sides))
+    arm = np.stack((
+        radius - radius * np.cos(theta),
+        -radius * np.sin(theta),
+        np.arange(zone_sides + 1) * (height / zone_sides),
+    ), axis=1)
+    return np.diff(arm, axis=0)
+
+def interval_keys(start, length, zone_sides):
+    # Empty and full intervals are the same point whatever the start
+    start = np.where((length == 0) | (length == zone_sides), 0, start % zone_sides)
+    return start, length
+
+def run_vertices(keys, generators):
+    # Vertices from their (start, length, start, length) runs over the cyclic generator list
+    prefix = np.concatenate(([[0, 0, 0]], np.cumsum(np.concatenate((generators, generators)), axis=0)))
+    return (
+        prefix[keys[:, 0] + keys[:, 1]] - prefix[keys[:, 0]] +
+        prefix[keys[:, 2] + keys[:, 3]] - prefix[keys[:, 2]]
     )
 
-    return all_polygons
+def zonohedron_runs(params):
+    # Every vertex is the sum of one or two runs of consecutive generators,
+    # so vertices are identified by their runs and never need welding.
+    # Returns the run keys and the (sides, bands, detail) grid of quads between them
+    zone_sides = params.sides * params.detail
+    detail = params.detail
+    m, i, j = np.meshgrid(
+        np.arange(params.sides),
+        np.arange(zone_sides - detail + 1),
+        np.arange(detail + 1),
+        indexing="ij"
+    )
+    a_start, a_len = m * detail, j
+    b_start, b_len = m * detail + detail, i
+
+    # Merge the runs when they touch, otherwise keep both
+    merged_start = np.select(
+        [i == 0, j == detail, i == zone_sides - detail, j == 0],
+        [a_start, a_start, b_start, b_start],
+        a_start
+    )
+    merged_len = np.select(
+        [i == 0, j == detail, i == zone_sides - detail, j == 0],
+        [a_len, a_len + b_len, a_len + b_len, b_len],
+        -1
+    )
+    single = merged_len >= 0
+    s1, l1 = interval_keys(np.where(single, merged_start, a_start), np.where(single, merged_len, a_len), zone_sides)
+    s2, l2 = interval_keys(np.where(single, 0, b_start), np.where(single, 0, b_len), zone_sides)
+
+    keys = np.stack((s1, l1, s2, l2), axis=-1).reshape(-1, 4)
+    keys, vertex_ids = np.unique(keys, axis=0, return_inverse=True)
+    vertex_ids = vertex_ids.reshape(m.shape)
+    # Wound counter clockwise seen from outside, like the leaves of create_zonohedron
+    quads = np.stack((
+        vertex_ids[:, :-1, :-1],
+        vertex_ids[:, 1:, :-1],
+        vertex_ids[:, 1:, 1:],
+        vertex_ids[:, :-1, 1:],
+    ), axis=-1).reshape(-1, 4)
+    return keys, quads
+
+def create_zonohedron_mesh(params, progress=no_progress):
+    zone_sides = params.sides * params.detail
+    detail = params.detail
+    generators = zonohedron_generators(params) * (-1, -1, 1)  # Rotated 180 like the arms
+    keys, quads = zonohedron_runs(params)
+    progress(0.5)
+    zmesh = ZoneMesh(run_vertices(keys, generators), quads.ravel(), np.arange(0, quads.size + 1, 4))
+    arm, band, segment = np.meshgrid(
+        np.arange(params.sides),
+        np.arange(zone_sides - detail),
+        np.arange(detail),
+        indexing="ij"
+    )
+    zmesh.face_attributes = {"zone_arm": arm.ravel(), "zone_band": band.ravel(), "zone_segment": segment.ravel()}
+    if params.detail == 1:
+        # Only the standard solid is the full Minkowski sum of its generators
+        zmesh.generators = generators
+    return zmesh
+
+def merge_generators(generators, tolerance=1e-9):
+    # Parallel and antiparallel generators sweep the same zone, so the solid
+    # is unchanged when they become one generator of their summed length
+    generators = np.asarray(generators, dtype=np.float64).reshape(-1, 3)
+    lengths = np.linalg.norm(generators, axis=1)
+    zero = np.flatnonzero(lengths <= 1e-12)
+    if zero.size:
+        raise ValueError("Generator %d has zero length" % (zero[0] + 1))
+    units = generators / lengths[:, None]
+    merged = []
+    used = np.zeros(len(generators), dtype=bool)
+    for i in range(len(generators)):
+        if used[i]:
+            continue
+        group = ~used & (np.abs(units @ units[i]) >= 1 - tolerance)
+        used |= group
+        merged.append(units[i] * lengths[group].sum())
+    return np.array(merged).reshape(-1, 3)
+
+def create_generator_mesh(params, progress=no_progress):
+    # Walk the zone of every generator: the other generators sorted by angle
+    # around it give the belt of parallelograms in order, O(n^2 log n) overall
+    generators = merge_generators(params.generators)
+    count = len(generators)
+    if count < 3:
+        raise ValueError("At least 3 non-parallel generator vectors are needed")
+    if np.linalg.matrix_rank(generators / np.linalg.norm(generators, axis=1)[:, None], tol=1e-9) < 3:
+        raise ValueError("Generator vectors all lie in one plane")
+    scale = np.abs(generators).max()
+
+    # Break ties between coplanar generators the same way in every zone
+    rng = np.random.default_rng(0)
+    perturbed = generators + rng.standard_normal(generators.shape) * scale * 1e-7
+
+    quads = []
+    zones = []
+    for i in range(count):
+        progress(i / count)
+        axis = perturbed[i] / np.linalg.norm(perturbed[i])
+        helper = (1, 0, 0) if abs(axis[0]) < 0.9 else (0, 1, 0)
+        u = np.cross(axis, helper)
+        u /= np.linalg.norm(u)
+        w = np.cross(axis, u)
+
+        others = np.delete(np.arange(count), i)
+        angle = np.arctan2(perturbed[others] @ w, perturbed[others] @ u)
+        flip = angle < 0
+        angle[flip] += math.pi
+        order = np.argsort(angle)
+        others = others[order]
+        steps = generators[others] * np.where(flip[order], -1, 1)[:, None]
+
+        # Belt around the zone: up the sorted steps then back down
+        steps = np.concatenate((steps, -steps))
+        belt = -steps[:count - 1].sum(axis=0) / 2 + np.concatenate(([[0, 0, 0]], np.cumsum(steps, axis=0)))
+        half = generators[i] / 2
+
+        # Each face belongs to two zones, keep it in the zone of the lower index
+        keep = np.concatenate((others, others)) > i
+        start, end = belt[:-1][keep], belt[1:][keep]
+        quads.append(np.stack((start - half, end - half, end + half, start + half), axis=1))
+        zones.append(np.stack((np.full(keep.sum(), i), np.concatenate((others, others))[keep]), axis=1))
+
+    quads = np.concatenate(quads)
+    zones = np.concatenate(zones)
+    # Point every face away from the centre
+    normal = np.cross(quads[:, 1] - quads[:, 0], quads[:, 3] - quads[:, 0])
+    inward = np.einsum("nc,nc->n", normal, quads.mean(axis=1)) < 0
+    quads[inward] = quads[inward][:, ::-1]
+
+    zmesh = ZoneMesh(quads.reshape(-1, 3), np.arange(quads.shape[0] * 4), np.arange(0, quads.shape[0] * 4 + 1, 4))
+    # A face is in the zones of both its generators, arm is the lower one
+    zmesh.face_attributes = {"zone_arm": zones[:, 0], "zone_band": zones[:, 1], "zone_segment": np.zeros(len(zones), dtype=np.int64)}
+    # Same weld as the other engines, taken before finalize_mesh scales the solid to the width
+    zmesh = weld_mesh(zmesh, WELD_TOLERANCE * np.ptp(zmesh.verts[:, 0]))
+    zmesh.generators = generators
+    return zmesh
+
+MESH_ENGINES = {
+    'standard': create_zonohedron_mesh,
+    'spirallohedra': create_zonohedron_mesh,
+    'generators': create_generator_mesh,
+}
 
-def create_curved_zonohedron():
-    center = {"x": 0, "y": 0, "z": 0}
-    radius = zoneData.width/2
-    height = radius * 4
-    degrees = 360/zoneData.sides
-    all_edges = []
-    num_of_points = zoneData.sides * zoneData.detail;
-    arm_clockwise = create_spiral(height, radius, center, num_of_points,  True)
-    arm_counter = create_spiral(height, radius, center, num_of_points, False)
-    
-    for i in range(zoneData.sides + 1):
-        all_edges.append(
-            rotate_point_list(arm_clockwise, i * degrees, center)
+GENERATORS = {
+    'standard': create_zonohedron,
+    'spirallohedra': create_zonohedron,
+    'spiral': create_spiral_zonohedron,
+    'curved': create_curved_zonohedron,
+    'generators': create_generator_zonohedron,
+}
+
+def normalize_params(params):
+    if params.zono_type == 'standard':
+        params = replace(params, detail=1)
+    if params.zono_type != 'generators' and params.generators:
+        params = replace(params, generators=())
+    if params.zono_type != 'curved' and params.curve_tolerance:
+        params = replace(params, curve_tolerance=0.0)
+    # Adaptive curves take their sample count from the tolerance alone
+    if params.zono_type == 'curved' and params.curve_tolerance:
+        params = replace(params, detail=1)
+    return params
+
+def build_zonohedron(params, progress=no_progress):
+    # Pure geometry, safe to run off the main thread
+    params = normalize_params(params)
+    if params.zono_type in MESH_ENGINES:
+        zmesh = MESH_ENGINES[params.zono_type](params, progress)
+        progress(1)
+        zmesh = finalize_mesh(zmesh, params, weld=False)
+    else:
+        zmesh = build_polygon_zonohedron(params, progress)
+    zmesh.metrics = zone_metrics(zmesh)
+    return zmesh
+
+def build_polygon_zonohedron(params, progress=no_progress):
+    # Reference path: snapped point lists welded afterwards
+    params = normalize_params(params)
+    result = GENERATORS[params.zono_type](params, progress)
+    progress(1)
+    if params.zono_type == 'curved':
+        zmesh = lines_to_mesh(result)
+    else:
+        zmesh = polygons_to_mesh(result)
+    return finalize_mesh(zmesh, params)
+
+def build_zonohedra(params_list, workers=None, cache_dir=None, max_bytes=0):
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda params: build_zonohedron_cached(params, cache_dir, max_bytes), params_list))
+
+# --- Size estimates ---
+# Engine buffers plus the Blender mesh, in bytes per element
+ESTIMATE_BYTES = {"vertices": 36, "edges": 24, "loops": 16, "faces": 12}
+
+def estimate_zonohedron(params):
+    # Closed form counts of the finished mesh, without building it
+    params = normalize_params(params)
+    n, d = params.sides, params.detail
+    faces = 0
+    if params.zono_type in ('standard', 'spirallohedra'):
+        faces = n * d * d * (n - 1)
+    elif params.zono_type == 'spiral':
+        faces = n * (n - 1) * (1 + 2 * params.spirals)
+    elif params.zono_type == 'generators':
+        try:
+            k = len(merge_generators(params.generators))
+        except ValueError:
+            k = 0
+        faces = k * (k - 1) if k >= 3 else 0
+
+    if params.zono_type == 'curved':
+        # 2n arms of `points` segments meeting at both ends. Clockwise and counter clockwise arms cross
+        # at half a turn plus whole sides, those crossings are shared vertices when they land on samples
+        if params.curve_tolerance:
+            points = len(adaptive_steps(params, params.width * 2, params.width / 2)) - 1
+        else:
+            points = n * d
+        on_grid = n % 2 == 0 or (points // n) % 2 == 0
+        crossings = n * n - (0 if n % 2 else n)
+        verts = 2 * n * (points - 1) + 2 - (crossings if on_grid else 0)
+        # When the first sample is already a crossing, arms share their end segments
+        edges = 2 * n * points - (2 * n if (2 * n - n * points) % (2 * points) == 0 else 0)
+        loops = 0
+    else:
+        # Closed quad meshes: V - E + F = 2 with E = 2F
+        verts = faces + 2 if faces else 0
+        edges = 2 * faces
+        loops = 4 * faces
+
+    counts = {"vertices": verts, "edges": edges, "loops": loops, "faces": faces}
+    counts["memory"] = sum(counts[key] * size for key, size in ESTIMATE_BYTES.items())
+    return counts
+
+def coarser_params(params):
+    # One level of detail down: tolerance, then detail, then spirals, then sides. None at the bottom
+    if params.zono_type == 'curved' and params.curve_tolerance and params.curve_tolerance < 0.1:
+        return replace(params, curve_tolerance=min(params.curve_tolerance * 2, 0.1))
+    if params.detail > 1 and params.zono_type in ('spirallohedra', 'curved'):
+        return replace(params, detail=params.detail - 1)
+    if params.spirals > 1 and params.zono_type == 'spiral':
+        return replace(params, spirals=params.spirals - 1)
+    if params.sides > 3 and params.zono_type != 'generators':
+        return replace(params, sides=params.sides - 1)
+    return None
+
+def fit_budget(params, max_bytes):
+    params = normalize_params(params)
+    while params is not None and estimate_zonohedron(params)["memory"] > max_bytes:
+        params = coarser_params(params)
+    return params
+
+def apply_budget(scene, params):
+    # Parameters to build within the scene's budget and a note for the user, or None when over it
+    max_bytes = scene.zonohedron_budget * 1024 * 1024
+    memory = estimate_zonohedron(params)["memory"]
+    if memory <= max_bytes:
+        return params, None
+    if scene.zonohedron_budget_mode == 'LOD':
+        fitted = fit_budget(params, max_bytes)
+        if fitted is not None:
+            return fitted, "Over budget, built with %d sides, detail %d, %d spirals" % (
+                fitted.sides, fitted.detail, fitted.spirals)
+    return None, "Estimated %.0f MB is over the %d MB budget" % (memory / 1024 / 1024, scene.zonohedron_budget)
+
+# --- Geometry cache ---
+CACHE_VERSION = 4
+CACHE_ARRAYS = ("verts", "loops", "offsets", "edges")
+CACHE_LOCK = threading.Lock()  # Array builds store and prune from several workers
+
+def cache_key(params):
+    recipe = repr((CACHE_VERSION,) + astuple(normalize_params(params)))
+    return hashlib.sha1(recipe.encode("utf-8")).hexdigest()
+
+def cache_load(cache_dir, params):
+    entry = os.path.join(cache_dir, cache_key(params))
+    try:
+        arrays = [np.load(os.path.join(entry, name + ".npy"), mmap_mode="r") for name in CACHE_ARRAYS]
+        attributes = {
+            name: np.load(os.path.join(entry, name + ".npy"), mmap_mode="r")
+            for name in ZONE_ATTRIBUTES if os.path.exists(os.path.join(entry, name + ".npy"))
+        }
+        os.utime(entry)  # Mark as recently used
+    except (OSError, ValueError):
+        return None
+    zmesh = ZoneMesh(*arrays)
+    zmesh.face_attributes = attributes
+    return zmesh
+
+def cache_store(cache_dir, params, zmesh, max_bytes):
+    os.makedirs(cache_dir, exist_ok=True)
+    # Write into a temporary folder first so readers never see half an entry
+    staging = tempfile.mkdtemp(dir=cache_dir, prefix=".tmp")
+    for name in CACHE_ARRAYS:
+        np.save(os.path.join(staging, name + ".npy"), np.ascontiguousarray(getattr(zmesh, name)))
+    for name in ZONE_ATTRIBUTES:
+        if name in zmesh.face_attributes:
+            np.save(os.path.join(staging, name + ".npy"), np.ascontiguousarray(zmesh.face_attributes[name]))
+    with CACHE_LOCK:
+        try:
+            os.replace(staging, os.path.join(cache_dir, cache_key(params)))
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+        cache_prune(cache_dir, max_bytes)
+
+def cache_prune(cache_dir, max_bytes):
+    entries = []
+    for name in os.listdir(cache_dir):
+        entry = os.path.join(cache_dir, name)
+        if name.startswith(".") or not os.path.isdir(entry):
+            continue
+        # Another process may remove or replace the entry while it is measured
+        try:
+            size = sum(f.stat().st_size for f in os.scandir(entry))
+            entries.append((os.stat(entry).st_mtime, size, entry))
+        except OSError:
+            continue
+
+    # Least recently used entries go first
+    total = sum(size for _, size, _ in entries)
+    for _, size, entry in sorted(entries):
+        if total <= max_bytes:
+            break
+        shutil.rmtree(entry, ignore_errors=True)
+        total -= size
+
+def build_zonohedron_cached(params, cache_dir=None, max_bytes=0, progress=no_progress):
+    if cache_dir is None:
+        return build_zonohedron(params, progress)
+    zmesh = cache_load(cache_dir, params)
+    if zmesh is None:
+        zmesh = build_zonohedron(params, progress)
+        cache_store(cache_dir, params, zmesh, max_bytes)
+    else:
+        zmesh.metrics = zone_metrics(zmesh)
+    return zmesh
+
+def cache_settings(scene):
+    if not scene.zonohedron_cache:
+        return None, 0
+    cache_dir = bpy.utils.user_resource('CONFIG', path="zonohedron_cache", create=True)
+    return cache_dir, scene.zonohedron_cache_size * 1024 * 1024
+
+class GenerationTask:
+    # Runs build_zonohedron on a worker thread, polled from a modal operator
+    def __init__(self, params, cache_dir=None, max_bytes=0):
+        self.params = params
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.progress = 0.0
+        self.result = None
+        self.error = None
+        self.cancelled = False
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def report(self, fraction):
+        if self.cancelled:
+            raise GenerationCancelled()
+        self.progress = fraction
+
+    def run(self):
+        try:
+            self.result = build_zonohedron_cached(self.params, self.cache_dir, self.max_bytes, self.report)
+        except GenerationCancelled:
+            pass
+        except Exception as error:
+            self.error = error
+
+    def start(self):
+        self.thread.start()
+
+    def done(self):
+        return not self.thread.is_alive()
+
+def draw_zonohedron(params, cache_dir=None, max_bytes=0, uv_scale=None):
+    zmesh = build_zonohedron_cached(params, cache_dir, max_bytes)
+    if uv_scale is not None:
+        add_render_data(zmesh, uv_scale)
+    return link_zonohedron(zmesh, params, uv_scale)
+
+def link_zonohedron(zmesh, params, uv_scale=None):
+    obj = link_zone_mesh(zmesh, *ZONO_NAMES[params.zono_type], params=params, uv_scale=uv_scale)
+
+    for selected in bpy.context.selected_objects:
+        selected.select_set(False)
+    obj.select_set(True)
+    bpy.context.view_layer.objects.active = obj
+    return obj
+
+def draw_zonohedron_array(base_params, sides_range, spacing, cache_dir=None, max_bytes=0, uv_scale=None, budget=None):
+    params_list = [replace(base_params, sides=sides) for sides in sides_range]
+    if budget is not None:
+        params_list = [params for params in map(budget, params_list) if params is not None]
+    collection = bpy.data.collections.new("ZonohedronVariants")
+    bpy.context.scene.collection.children.link(collection)
+
+    # Geometry is computed on the pool, the main thread only links the meshes
+    objects = []
+    for i, (params, zmesh) in enumerate(zip(params_list, build_zonohedra(params_list, cache_dir=cache_dir, max_bytes=max_bytes))):
+        object_name, mesh_name = ZONO_NAMES[params.zono_type]
+        if uv_scale is not None:
+            add_render_data(zmesh, uv_scale)
+        obj = link_zone_mesh(
+            zmesh,
+            "%s_%d" % (object_name, params.sides),
+            "%s_%d" % (mesh_name, params.sides),
+            collection,
+            params,
+            uv_scale
         )
-        all_edges.append(
-            rotate_point_list(arm_counter, i * degrees, center)
+        obj.location = (i * spacing, 0, 0)
+        objects.append(obj)
+    return objects
+
+# --- Recipes ---
+_stashed_meshes = {}
+
+def params_to_recipe(params):
+    recipe = asdict(params)
+    recipe["generators"] = [c for vector in params.generators for c in vector]
+    return recipe
+
+def recipe_to_params(recipe):
+    recipe = recipe.to_dict() if hasattr(recipe, "to_dict") else dict(recipe)
+    for key in ("fingerprint", "render_ready", "uv_scale"):
+        recipe.pop(key, None)
+    flat = list(recipe.get("generators", ()))
+    recipe["generators"] = tuple(tuple(flat[i:i + 3]) for i in range(0, len(flat), 3))
+    return ZoneParams(**recipe)
+
+def read_zone_mesh(mesh):
+    verts, edges = read_mesh_arrays(mesh)
+    loop_start, loop_total, loops = read_mesh_faces(mesh)
+    offsets = np.concatenate((loop_start, [len(loops)]))
+    # Face edges are rebuilt by calc_edges, only wireframes keep theirs
+    zmesh = ZoneMesh(verts, loops, offsets, None if len(loop_start) else edges)
+
+    # Keep render data and face attributes so the mesh can be filled again unchanged
+    if mesh.uv_layers.active is not None:
+        uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+        mesh.uv_layers.active.data.foreach_get("uv", uvs)
+        zmesh.uvs = uvs.reshape(-1, 2).astype(np.float64)
+    if mesh.has_custom_normals:
+        normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+        if bpy.app.version < (4, 1, 0):
+            mesh.calc_normals_split()
+            mesh.loops.foreach_get("normal", normals)
+        else:
+            mesh.corner_normals.foreach_get("vector", normals)
+        zmesh.loop_normals = normals.reshape(-1, 3).astype(np.float64)
+    for attr in mesh.attributes:
+        if attr.domain == 'FACE' and attr.data_type in ('INT', 'FLOAT') and not attr.name.startswith("."):
+            values = np.empty(len(mesh.polygons), dtype=np.int32 if attr.data_type == 'INT' else np.float32)
+            attr.data.foreach_get("value", values)
+            zmesh.face_attributes[attr.name] = values
+    return zmesh
+
+# foreach_get field, values per element and dtype of each attribute type
+ATTRIBUTE_FIELDS = {
+    'FLOAT': ("value", 1, np.float32),
+    'INT': ("value", 1, np.int32),
+    'INT8': ("value", 1, np.int8),
+    'BOOLEAN': ("value", 1, bool),
+    'FLOAT2': ("vector", 2, np.float32),
+    'FLOAT_VECTOR': ("vector", 3, np.float32),
+    'INT16_2D': ("value", 2, np.int16),
+    'INT32_2D': ("value", 2, np.int32),
+    'FLOAT_COLOR': ("color", 4, np.float32),
+    'BYTE_COLOR': ("color", 4, np.float32),
+    'QUATERNION': ("value", 4, np.float32),
+    'FLOAT4X4': ("value", 16, np.float32),
+}
+
+def mesh_fingerprint(mesh):
+    # Counts and a hash of every attribute layer: positions, topology, UV maps, seams, sharp and
+    # smooth flags, custom normals, materials and added attributes, so any edit after generation
+    # changes it. Selection is left out, it is not part of the model
+    digest = hashlib.sha1()
+    for attr in sorted(mesh.attributes, key=lambda attr: attr.name):
+        if "select" in attr.name:
+            continue
+        digest.update(("%s:%s:%s" % (attr.name, attr.domain, attr.data_type)).encode())
+        if attr.data_type in ATTRIBUTE_FIELDS:
+            field, width, dtype = ATTRIBUTE_FIELDS[attr.data_type]
+            values = np.empty(len(attr.data) * width, dtype=dtype)
+            attr.data.foreach_get(field, values)
+            digest.update(values.tobytes())
+    return "%d:%d:%d:%s" % (len(mesh.vertices), len(mesh.edges), len(mesh.polygons), digest.hexdigest())
+
+def recipe_objects():
+    return [
+        obj for obj in bpy.data.objects
+        if obj.type == 'MESH' and "zonohedron_recipe" in obj and obj.data.users == 1
+    ]
+
+def proxy_objects():
+    # Only meshes the recipe still rebuilds exactly, edited ones are saved whole. Vertex group
+    # weights are not attribute layers, generated meshes have none
+    return [
+        obj for obj in recipe_objects()
+        if obj.mode != 'EDIT' and obj.data.shape_keys is None and not obj.vertex_groups
+        and obj["zonohedron_recipe"].get("fingerprint") == mesh_fingerprint(obj.data)
+    ]
+
+def recipe_uv_scale(recipe):
+    return recipe.get("uv_scale", 1.0) if recipe.get("render_ready") else None
+
+def regenerate_recipes(objects, cache_dir=None, max_bytes=0):
+    params_list = [recipe_to_params(obj["zonohedron_recipe"]) for obj in objects]
+    for obj, zmesh in zip(objects, build_zonohedra(params_list, cache_dir=cache_dir, max_bytes=max_bytes)):
+        uv_scale = recipe_uv_scale(obj["zonohedron_recipe"])
+        if uv_scale is not None:
+            add_render_data(zmesh, uv_scale)
+        obj.data.clear_geometry()
+        fill_mesh(obj.data, zmesh)
+
+@bpy.app.handlers.persistent
+def zonohedron_save_pre(*args):
+    # Save only the recipe, the geometry is put back straight after saving
+    if not bpy.context.scene.zonohedron_parametric:
+        return
+    for obj in proxy_objects():
+        _stashed_meshes[obj.data.name] = read_zone_mesh(obj.data)
+        obj.data.clear_geometry()
+
+@bpy.app.handlers.persistent
+def zonohedron_save_post(*args):
+    for name, zmesh in _stashed_meshes.items():
+        mesh = bpy.data.meshes.get(name)
+        if mesh is not None and not len(mesh.vertices):
+            fill_mesh(mesh, zmesh)
+    _stashed_meshes.clear()
+
+@bpy.app.handlers.persistent
+def zonohedron_load_post(*args):
+    _refinements.clear()
+    proxies = [obj for obj in recipe_objects() if not len(obj.data.vertices)]
+    if proxies:
+        regenerate_recipes(proxies, *cache_settings(bpy.context.scene))
+
+# --- Incremental refinement ---
+_refinements = {}
+
+class SpiralRefinement:
+    # A spiral zonohedron is a top shell, one spiral case per spiral and a bottom shell.
+    # Each piece is built and welded once, a new spiral count only restacks them. The stack
+    # goes through finalize_mesh like a fresh build, so both give the same mesh
+    def __init__(self, params):
+        self.params = params
+        *stores, height = spiral_zonohedron_pieces(params)
+        pieces = [polygons_to_mesh(store) for store in stores]
+        low = min(piece.verts[:, 0].min() for piece in pieces)
+        high = max(piece.verts[:, 0].max() for piece in pieces)
+        # The weld finalize_mesh uses, in the units of the unscaled pieces
+        self.top, self.case, self.bottom = [weld_mesh(piece, WELD_TOLERANCE * (high - low)) for piece in pieces]
+        self.step = np.array((0, 0, height))
+
+    def accepts(self, params):
+        return replace(params, spirals=self.params.spirals) == self.params
+
+    def build(self, params, progress=no_progress):
+        # Segments count up from the top shell: 0 top, one per spiral, spirals + 1 bottom
+        placed = [(self.top, 0, 0)]
+        placed += [(self.case, i, i + 1) for i in range(params.spirals)]
+        placed += [(self.bottom, params.spirals - 1, params.spirals + 1)]
+        starts = np.cumsum([0] + [len(piece.verts) for piece, _, _ in placed])
+        verts = np.concatenate([piece.verts + self.step * shift for piece, shift, _ in placed])
+        loops = np.concatenate([piece.loops + start for (piece, _, _), start in zip(placed, starts)])
+        totals = np.concatenate([piece.loop_total for piece, _, _ in placed])
+        zmesh = ZoneMesh(verts, loops, np.concatenate(([0], np.cumsum(totals))))
+        zmesh.face_attributes = {
+            name: np.concatenate([
+                np.full(piece.face_count, segment) if name == "zone_segment"
+                else piece.face_attributes.get(name, np.zeros(piece.face_count, dtype=np.int64))
+                for piece, _, segment in placed
+            ])
+            for name in ZONE_ATTRIBUTES
+        }
+        progress(0.5)
+        self.params = params
+        return finalize_mesh(zmesh, params)
+
+class CurvedRefinement:
+    # A curved wireframe is two base arms copied around the axis, a new detail only samples the missing points
+    def __init__(self, params):
+        self.params = params
+        self.radius = params.width / 2
+        self.height = self.radius * 4
+        self.arms = curved_arms(params)
+
+    def accepts(self, params):
+        return replace(params, detail=self.params.detail) == self.params
+
+    def build(self, params, progress=no_progress):
+        if params.curve_tolerance:
+            return self.finish(params)
+        # Points are compared by their step on the finer common grid of both details
+        old_points = self.params.sides * self.params.detail
+        num_of_points = params.sides * params.detail
+        common = old_points * num_of_points // math.gcd(old_points, num_of_points)
+        old_steps = np.arange(old_points + 1) * (common // old_points)
+        steps = np.arange(num_of_points + 1) * (common // num_of_points)
+        found = np.minimum(np.searchsorted(old_steps, steps), old_points)
+        present = old_steps[found] == steps
+        missing = np.nonzero(~present)[0]
+
+        arms = np.empty((2, num_of_points + 1, 3))
+        arms[:, present] = self.arms[:, found[present]]
+        for arm, clockwise in zip(arms, (True, False)):
+            arm[missing] = create_spiral(params, self.height, self.radius, (0, 0, 0), num_of_points, clockwise, missing)
+        self.arms = arms
+        self.params = params
+        return self.finish(params)
+
+    def finish(self, params):
+        lines = PolygonStore.from_array(self.arms).rotate(np.arange(params.sides + 1) * (360 / params.sides))
+        return finalize_mesh(lines_to_mesh(lines), params)
+
+REFINEMENTS = {
+    'spiral': SpiralRefinement,
+    'curved': CurvedRefinement,
+}
+
+def refine_zonohedron(key, params, progress=no_progress):
+    # Step the last build kept under key to params, starting over when more than the refinable value changed
+    params = normalize_params(params)
+    state = _refinements.get(key)
+    if state is None or not state.accepts(params):
+        if params.zono_type not in REFINEMENTS:
+            _refinements.pop(key, None)
+            return build_zonohedron(params, progress)
+        state = _refinements[key] = REFINEMENTS[params.zono_type](params)
+    zmesh = state.build(params, progress)
+    if zmesh.metrics is None:
+        zmesh.metrics = zone_metrics(zmesh)
+    return zmesh
+
+def update_zonohedron(obj, params, uv_scale=None):
+    zmesh = refine_zonohedron(obj.name, params)
+    if uv_scale is not None:
+        add_render_data(zmesh, uv_scale)
+    obj.data.clear_geometry()
+    fill_mesh(obj.data, zmesh)
+    write_zone_properties(obj, zmesh, params, uv_scale)
+    return zmesh
+
+def zonohedron_live_update(scene, context):
+    obj = context.active_object
+    if (scene.zonohedron_live_update and obj is not None and obj.type == 'MESH'
+            and "zonohedron_recipe" in obj and obj.data.shape_keys is None):
+        params, _ = apply_budget(scene, ZoneParams.from_scene(scene))
+        if params is not None:
+            update_zonohedron(obj, params, scene.zonohedron_uv_scale if scene.zonohedron_render_ready else None)
+
+# --- Render data ---
+def add_render_data(zmesh, uv_scale=1.0, tolerance=1e-5):
+    # Per loop UVs in each face's canonical frame, so congruent faces share a layout,
+    # and flat per loop normals
+    zmesh.uvs = np.zeros((len(zmesh.loops), 2))
+    zmesh.loop_normals = np.zeros((len(zmesh.loops), 3))
+    totals = zmesh.loop_total
+    for n in np.unique(totals):
+        if n < 3:
+            continue
+        idx = np.nonzero(totals == n)[0]
+        loop_ids = zmesh.offsets[idx][:, None] + np.arange(n)
+        pts = zmesh.verts[zmesh.loops[loop_ids]]
+        order, _, _, normal, _, _, local = canonical_layouts(pts, tolerance, windings=(1,))
+        targets = np.take_along_axis(loop_ids, order, axis=1)
+        zmesh.uvs[targets] = local * uv_scale
+        zmesh.loop_normals[loop_ids] = normal[:, None]
+    return zmesh
+
+# --- Planarity ---
+def face_planarity(zmesh):
+    # Largest distance of each face's corners from its best fit plane, triangles are flat
+    deviation = np.zeros(zmesh.face_count)
+    totals = zmesh.loop_total
+    for n in np.unique(totals):
+        if n < 4:
+            continue
+        idx = np.nonzero(totals == n)[0]
+        pts = zmesh.verts[zmesh.loops[zmesh.offsets[idx][:, None] + np.arange(n)]]
+        if n == 4:
+            # The plane parallel to both diagonals sits halfway between them, every corner is equally far off
+            cross = np.cross(pts[:, 2] - pts[:, 0], pts[:, 3] - pts[:, 1])
+            length = np.linalg.norm(cross, axis=1)
+            gap = np.abs(np.einsum("nc,nc->n", pts[:, 1] - pts[:, 0], cross))
+            deviation[idx] = np.where(length > 0, gap / np.where(length > 0, length, 1), 0) / 2
+            continue
+        pts = pts - pts.mean(axis=1)[:, None]
+        # The plane normal is the eigenvector of the smallest covariance eigenvalue
+        _, vectors = np.linalg.eigh(np.einsum("nki,nkj->nij", pts, pts))
+        deviation[idx] = np.abs(pts @ vectors[:, :, :1]).max(axis=(1, 2))
+    return deviation
+
+def triangulate_faces(zmesh, split):
+    # Split the chosen faces into triangles, quads along their shorter diagonal and larger faces as fans.
+    # Loop data and face attributes follow the loops and faces they came from
+    totals = zmesh.loop_total
+    split = split & (totals > 3)
+    counts = np.where(split, totals - 2, 1)
+    source = np.repeat(np.arange(zmesh.face_count), counts)
+    new_totals = np.where(split[source], 3, totals[source])
+    offsets = np.concatenate(([0], np.cumsum(new_totals)))
+    loop_ids = np.empty(offsets[-1], dtype=np.int64)
+
+    kept = np.nonzero(~split[source])[0]
+    n = new_totals[kept]
+    within = np.arange(n.sum()) - np.repeat(np.cumsum(n) - n, n)
+    loop_ids[np.repeat(offsets[kept], n) + within] = np.repeat(zmesh.offsets[source[kept]], n) + within
+
+    # Fan from corner 1 instead of 0 when that gives a quad the shorter diagonal
+    root = np.zeros(zmesh.face_count, dtype=np.int64)
+    quads = np.nonzero(split & (totals == 4))[0]
+    pts = zmesh.verts[zmesh.loops[zmesh.offsets[quads][:, None] + np.arange(4)]]
+    root[quads] = np.linalg.norm(pts[:, 3] - pts[:, 1], axis=1) < np.linalg.norm(pts[:, 2] - pts[:, 0], axis=1)
+
+    tris = np.nonzero(split[source])[0]
+    face = source[tris]
+    t = tris - (np.cumsum(counts) - counts)[face]
+    corners = np.stack((np.zeros_like(t), t + 1, t + 2), axis=1)
+    corners = (root[face][:, None] + corners) % totals[face][:, None]
+    loop_ids[offsets[tris][:, None] + np.arange(3)] = zmesh.offsets[face][:, None] + corners
+
+    result = ZoneMesh(zmesh.verts, zmesh.loops[loop_ids], offsets, zmesh.edges, zmesh.generators)
+    result.metrics = zmesh.metrics
+    if zmesh.uvs is not None:
+        result.uvs = zmesh.uvs[loop_ids]
+    if zmesh.loop_normals is not None:
+        result.loop_normals = zmesh.loop_normals[loop_ids]
+    result.face_attributes = {name: values[source] for name, values in zmesh.face_attributes.items()}
+    return result
+
+def check_planarity(obj, tolerance, triangulate=False):
+    mesh = obj.data
+    zmesh = read_zone_mesh(mesh)
+    deviation = face_planarity(zmesh)
+    zmesh.face_attributes["planarity"] = deviation
+    warped = deviation > tolerance
+    if triangulate and warped.any():
+        zmesh = triangulate_faces(zmesh, warped)
+        mesh.clear_geometry()
+        fill_mesh(mesh, zmesh)
+        # The recipe would rebuild the warped faces
+        if "zonohedron_recipe" in obj:
+            del obj["zonohedron_recipe"]
+    else:
+        set_face_attribute(mesh, "planarity", deviation, 'FLOAT')
+    obj["zonohedron_planarity"] = float(deviation.max()) if len(deviation) else 0.0
+    return deviation, int(warped.sum())
+
+# --- Truncation ---
+def cap_loops(starts, ends):
+    # Chain directed boundary edges into closed loops, open chains are dropped
+    following = dict(zip(starts.tolist(), ends.tolist()))
+    loops = []
+    while following:
+        start, vertex = following.popitem()
+        loop = [start]
+        while vertex != start and vertex in following:
+            loop.append(vertex)
+            vertex = following.pop(vertex)
+        if vertex == start and len(loop) >= 3:
+            loops.append(loop)
+    return loops
+
+def clip_edges(zmesh, d):
+    # Wireframes: whole edges on the kept side stay, crossing edges end at the plane
+    a, b = zmesh.edges[:, 0], zmesh.edges[:, 1]
+    keep = (d[a] >= 0) & (d[b] >= 0) & ((d[a] > 0) | (d[b] > 0))
+    cut = d[a] * d[b] < 0
+    a_cut, b_cut = a[cut], b[cut]
+    t = d[a_cut] / (d[a_cut] - d[b_cut])
+    points = zmesh.verts[a_cut] + t[:, None] * (zmesh.verts[b_cut] - zmesh.verts[a_cut])
+    inside = np.where(d[a_cut] > 0, a_cut, b_cut)
+    new = len(zmesh.verts) + np.arange(cut.sum())
+    edges = np.concatenate((zmesh.edges[keep], np.stack((inside, new), axis=1)))
+    verts = np.concatenate((zmesh.verts, points))
+    used, edges = np.unique(edges, return_inverse=True)
+    return ZoneMesh(verts[used], edges=edges.reshape(-1, 2))
+
+def clip_mesh(zmesh, origin, normal, cap=True, tolerance=1e-6):
+    # Keep the side the normal points to. Every vertex is classified at once, faces crossing
+    # the plane are cut along their crossing edges and the opening is closed with cap faces
+    normal = np.asarray(normal, dtype=np.float64)
+    normal = normal / np.linalg.norm(normal)
+    d = (zmesh.verts - origin) @ normal
+    # Vertices within tolerance of the plane count as on it, so no sliver faces are made
+    scale = np.ptp(zmesh.verts, axis=0).max() if len(zmesh.verts) else 0
+    d[np.abs(d) <= tolerance * scale] = 0
+    if not zmesh.face_count:
+        return clip_edges(zmesh, d)
+
+    face = zmesh.face_index()
+    totals = zmesh.loop_total
+    keep_face = np.bincount(face, weights=d[zmesh.loops] > 0, minlength=zmesh.face_count) > 0
+    index = np.arange(len(zmesh.loops))
+    following = index + 1
+    following[zmesh.offsets[1:] - 1] = zmesh.offsets[:-1]
+    a, b = zmesh.loops, zmesh.loops[following]
+    keep_loop = keep_face[face]
+    emit_vertex = keep_loop & (d[a] >= 0)
+    emit_cross = keep_loop & (d[a] * d[b] < 0)
+
+    # One new vertex per cut edge, shared by the faces on both sides
+    lo = np.minimum(a[emit_cross], b[emit_cross])
+    hi = np.maximum(a[emit_cross], b[emit_cross])
+    keys, inverse = np.unique(np.stack((lo, hi), axis=1), axis=0, return_inverse=True)
+    inverse = inverse.ravel()
+    t = d[keys[:, 0]] / (d[keys[:, 0]] - d[keys[:, 1]])
+    points = zmesh.verts[keys[:, 0]] + t[:, None] * (zmesh.verts[keys[:, 1]] - zmesh.verts[keys[:, 0]])
+    verts = np.concatenate((zmesh.verts, points))
+    d = np.concatenate((d, np.zeros(len(points))))
+
+    # Every loop gives its own corner, then the crossing on the way to the next corner
+    crossing = np.full(len(zmesh.loops), -1)
+    crossing[emit_cross] = len(zmesh.verts) + inverse
+    slots = np.stack((emit_vertex, emit_cross), axis=1).ravel()
+    loops = np.stack((a, crossing), axis=1).ravel()[slots]
+    out_face = np.repeat(face, 2)[slots]
+    source = np.repeat(index, 2)[slots]
+    weight = np.zeros((len(zmesh.loops), 2))
+    weight[emit_cross, 1] = d[a[emit_cross]] / (d[a[emit_cross]] - d[b[emit_cross]])
+    weight = weight.ravel()[slots]
+
+    new_totals = np.bincount(out_face, minlength=zmesh.face_count)
+    faces = np.nonzero(new_totals >= 3)[0]
+    valid = new_totals[out_face] >= 3
+    loops, source, weight = loops[valid], source[valid], weight[valid]
+    offsets = np.concatenate(([0], np.cumsum(new_totals[faces])))
+
+    def loop_data(values):
+        return values[source] + weight[:, None] * (values[following[source]] - values[source])
+
+    uvs = None if zmesh.uvs is None else loop_data(zmesh.uvs)
+    loop_normals = None if zmesh.loop_normals is None else loop_data(zmesh.loop_normals)
+    attributes = {name: values[faces] for name, values in zmesh.face_attributes.items()}
+
+    if cap:
+        # Boundary edges lying in the plane, walked backwards so the caps face away from the kept side
+        next_loop = np.arange(len(loops)) + 1
+        next_loop[offsets[1:] - 1] = offsets[:-1]
+        start, end = loops, loops[next_loop]
+        count = len(verts)
+        boundary = ~np.isin(start * count + end, end * count + start)
+        boundary &= (d[start] == 0) & (d[end] == 0)
+        caps = cap_loops(end[boundary], start[boundary])
+        if caps:
+            cap_verts = np.concatenate(caps)
+            cap_totals = np.array([len(c) for c in caps])
+            loops = np.concatenate((loops, cap_verts))
+            offsets = np.concatenate((offsets, offsets[-1] + np.cumsum(cap_totals)))
+            if uvs is not None:
+                u = np.cross(normal, (1, 0, 0) if abs(normal[0]) < 0.9 else (0, 1, 0))
+                u /= np.linalg.norm(u)
+                local = verts[cap_verts] - origin
+                uvs = np.concatenate((uvs, np.stack((local @ u, local @ np.cross(normal, u)), axis=1)))
+            if loop_normals is not None:
+                loop_normals = np.concatenate((loop_normals, np.tile(-normal, (len(cap_verts), 1))))
+            # Caps form a zone of their own
+            for name, values in attributes.items():
+                fill = values.max() + 1 if values.dtype.kind in "iu" and len(values) else 0
+                attributes[name] = np.concatenate((values, np.full(len(caps), fill, dtype=values.dtype)))
+
+    used, loops = np.unique(loops, return_inverse=True)
+    result = ZoneMesh(verts[used], loops.ravel(), offsets)
+    if loop_normals is not None:
+        loop_normals /= np.linalg.norm(loop_normals, axis=1, keepdims=True)
+    result.uvs = uvs
+    result.loop_normals = loop_normals
+    result.face_attributes = attributes
+    return result
+
+def truncate_zonohedron(obj, height, keep='ABOVE', cap=True):
+    # Cut at a fraction of the object's local height, replacing a Bisect on dense meshes
+    mesh = obj.data
+    zmesh = read_zone_mesh(mesh)
+    if not len(zmesh.verts):
+        raise ValueError("%s has no geometry to truncate" % obj.name)
+    low, high = zmesh.verts[:, 2].min(), zmesh.verts[:, 2].max()
+    origin = np.array((0, 0, low + (high - low) * height))
+    normal = (0, 0, 1) if keep == 'ABOVE' else (0, 0, -1)
+    clipped = clip_mesh(zmesh, origin, normal, cap)
+    clipped.metrics = zone_metrics(clipped)
+    mesh.clear_geometry()
+    fill_mesh(mesh, clipped)
+    write_zone_properties(obj, clipped)
+    # The recipe would rebuild the whole solid
+    if "zonohedron_recipe" in obj:
+        del obj["zonohedron_recipe"]
+    return zmesh.face_count, clipped.face_count
+
+# --- Truss analysis ---
+# Pin jointed linear truss: one axial spring EA/L per edge on an assembled sparse stiffness matrix.
+# Ordered by breadth first levels from the supports the matrix is block tridiagonal, so a direct
+# block elimination costs sum(level size^3) and never iterates on the badly conditioned shells
+STEEL_DENSITY = 7850.0
+GRAVITY = 9.81
+
+def strut_groups(lengths, precision=4):
+    # Struts of the same length to the given decimals share a group
+    _, groups = np.unique(np.round(lengths, precision), return_inverse=True)
+    return groups.ravel()
+
+def tube_area(diameter, wall):
+    inner = max(diameter - 2 * wall, 0.0)
+    return math.pi * (diameter ** 2 - inner ** 2) / 4
+
+def parse_sections(text):
+    # One "group, diameter, wall" per line or separated by semicolons, '#' starts a comment
+    sections = {}
+    for line in text.replace(";", "\n").splitlines():
+        line = line.split("#")[0].strip()
+        if not line:
+            continue
+        try:
+            values = [float(v) for v in line.replace(",", " ").split()]
+        except ValueError:
+            continue  # Header row
+        if len(values) == 3:
+            sections[int(values[0])] = (values[1], values[2])
+    return sections
+
+def scene_sections(scene):
+    # Tube sizes in m per strut group, from the table in mm
+    sections = read_table(scene.zonohedron_truss_sections, parse_sections)
+    return {group: (d / 1000, w / 1000) for group, (d, w) in sections.items()}
+
+def section_areas(groups, diameter, wall, sections):
+    # One tube per strut group, the default tube where the table has no entry
+    table = np.full(groups.max() + 1 if len(groups) else 0, tube_area(diameter, wall))
+    for group, (d, w) in sections.items():
+        if not 0 <= group < len(table):
+            raise ValueError("The section table names strut group %d, the frame has groups 0 to %d" % (group, len(table) - 1))
+        table[group] = tube_area(d, w)
+    return table[groups]
+
+def truss_stiffness(verts, edges, axial):
+    # Coordinate triplets of the 3n x 3n matrix with duplicates summed, rows sorted.
+    # Each edge adds k n n^T to both diagonal blocks and -k n n^T to both off diagonal blocks
+    a, b = edges[:, 0], edges[:, 1]
+    direction = verts[b] - verts[a]
+    direction /= np.linalg.norm(direction, axis=1, keepdims=True)
+    block = axial[:, None, None] * direction[:, :, None] * direction[:, None, :]
+    i, j = np.meshgrid(np.arange(3), np.arange(3), indexing="ij")
+    rows, cols, data = [], [], []
+    for p, q, sign in ((a, a, 1), (b, b, 1), (a, b, -1), (b, a, -1)):
+        rows.append((3 * p[:, None, None] + i).ravel())
+        cols.append((3 * q[:, None, None] + j).ravel())
+        data.append((sign * block).ravel())
+    size = 3 * len(verts)
+    codes, inverse = np.unique(np.concatenate(rows) * size + np.concatenate(cols), return_inverse=True)
+    data = np.bincount(inverse.ravel(), np.concatenate(data))
+    return codes // size, codes % size, data
+
+def vertex_levels(edges, count, start):
+    # Breadth first level of every vertex from start, -1 where unreachable.
+    # Every edge joins a level to itself or to the next one
+    order = np.argsort(edges.ravel(), kind="stable")
+    neighbours = edges[:, ::-1].ravel()[order]
+    pointers = np.concatenate(([0], np.cumsum(np.bincount(edges.ravel(), minlength=count))))
+    level = np.full(count, -1)
+    level[start] = 0
+    frontier = np.nonzero(start)[0]
+    depth = 0
+    while len(frontier):
+        depth += 1
+        counts = pointers[frontier + 1] - pointers[frontier]
+        within = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        reached = neighbours[np.repeat(pointers[frontier], counts) + within]
+        frontier = np.unique(reached[level[reached] < 0])
+        level[frontier] = depth
+    return level
+
+def factor_levels(rows, cols, data, level):
+    # Block elimination over the levels of the free DOFs (level >= 1), the rest stay fixed at zero.
+    # Level l couples only to l - 1 and l + 1: S_l = K_ll - C_l S_l-1^+ C_l^T, C_l = K_l,l-1.
+    # S_l is the frame with later levels clamped, so its null vectors are mechanisms of the whole
+    # frame and C_l+1 maps them to zero: the pseudo inverse drops them without changing the rest
+    count = level.max() + 1 if len(level) else 0
+    dofs = [np.nonzero(level == l)[0] for l in range(count)]
+    local = np.zeros(len(level), dtype=np.int64)
+    for ids in dofs:
+        local[ids] = np.arange(len(ids))
+    diagonal = data[(rows == cols) & (level[rows] > 0)]
+    threshold = 1e-9 * (np.abs(diagonal).mean() if len(diagonal) else 1.0)
+
+    keep = (level[rows] > 0) & (level[cols] > 0) & (level[rows] >= level[cols])
+    rows, cols, data = rows[keep], cols[keep], data[keep]
+    group = level[rows] * 2 + (level[rows] > level[cols])
+    order = np.argsort(group, kind="stable")
+    rows, cols, data, group = rows[order], cols[order], data[order], group[order]
+    bounds = np.searchsorted(group, np.arange(2 * count + 1))
+
+    inverses = [None] * count
+    couplings = [None] * count
+    mechanisms = []
+    for l in range(1, count):
+        block = np.zeros((len(dofs[l]), len(dofs[l])))
+        span = slice(bounds[2 * l], bounds[2 * l + 1])
+        block[local[rows[span]], local[cols[span]]] += data[span]
+        if l > 1:
+            span = slice(bounds[2 * l + 1], bounds[2 * l + 2])
+            couplings[l] = np.zeros((len(dofs[l]), len(dofs[l - 1])))
+            couplings[l][local[rows[span]], local[cols[span]]] = data[span]
+            block -= (couplings[l] @ inverses[l - 1]) @ couplings[l].T
+        values, vectors = np.linalg.eigh(block)
+        stiff = values > threshold
+        inverses[l] = (vectors[:, stiff] / values[stiff]) @ vectors[:, stiff].T
+        # Each mechanism is named by the DOF it moves most
+        mechanisms.extend(dofs[l][np.abs(vectors[:, ~stiff]).argmax(axis=0)])
+    return dofs, couplings, inverses, np.array(mechanisms, dtype=np.int64)
+
+def solve_levels(factors, rhs):
+    dofs, couplings, inverses, _ = factors
+    forward = [None] * len(dofs)
+    for l in range(1, len(dofs)):
+        forward[l] = rhs[dofs[l]].astype(np.float64)
+        if l > 1:
+            forward[l] -= couplings[l] @ (inverses[l - 1] @ forward[l - 1])
+
+    x = np.zeros(len(rhs))
+    after = None
+    for l in range(len(dofs) - 1, 0, -1):
+        y = forward[l] if after is None else forward[l] - couplings[l + 1].T @ after
+        after = inverses[l] @ y
+        x[dofs[l]] = after
+    return x
+
+def factor_bytes(level):
+    # Memory held by the dense inverse and coupling block of every level
+    sizes = np.bincount(level)[1:].astype(np.float64)
+    return int(((sizes ** 2).sum() + (sizes[1:] * sizes[:-1]).sum()) * 8)
+
+def truss_analysis(verts, edges, area, modulus, fixed, density=STEEL_DENSITY, loads=None, max_bytes=0):
+    # SI units: verts in m, area in m^2 (one per edge or shared), modulus in Pa, loads (n, 3) in N.
+    # Self weight is lumped half to each end of a strut. Returns displacements (n, 3) in m,
+    # axial forces per edge in N (tension positive), the relative residual of the free DOFs
+    # and one vertex per mechanism, the one it moves most
+    verts = np.asarray(verts, dtype=np.float64)
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    edges = edges[edges[:, 0] != edges[:, 1]]
+    area = np.broadcast_to(np.asarray(area, dtype=np.float64), (len(edges),))
+    lengths = np.linalg.norm(verts[edges[:, 1]] - verts[edges[:, 0]], axis=1)
+    axial = modulus * area / lengths
+
+    force = np.zeros((len(verts), 3)) if loads is None else np.array(loads, dtype=np.float64)
+    weight = density * area * lengths * GRAVITY / 2
+    force[:, 2] -= np.bincount(edges.ravel(), np.repeat(weight, 2), minlength=len(verts))
+
+    rows, cols, data = truss_stiffness(verts, edges, axial)
+    fixed = np.asarray(fixed, dtype=bool)
+    level = vertex_levels(edges, len(verts), fixed)
+    # Parts with no path to a support are free bodies, they go last as one level of their own
+    used = np.zeros(len(verts), dtype=bool)
+    used[edges.ravel()] = True
+    level[used & (level < 0)] = level.max() + 1
+    level = np.repeat(np.maximum(level, 0), 3)
+    if max_bytes and factor_bytes(level) > max_bytes:
+        raise ValueError("The solver needs %.0f MB, over the %.0f MB budget" % (
+            factor_bytes(level) / 1024 / 1024, max_bytes / 1024 / 1024))
+    factors = factor_levels(rows, cols, data, level)
+
+    # A few rounds of refinement win back what the explicit inverses lose
+    free = level > 0
+    rhs = force.ravel()
+    scale = max(np.linalg.norm(rhs[free]), 1e-300)
+    displacement = np.zeros(len(level))
+    residual = np.inf
+    for _ in range(4):
+        step = displacement + solve_levels(factors, rhs - np.bincount(rows, data * displacement[cols], minlength=len(level)))
+        balance = np.linalg.norm((rhs - np.bincount(rows, data * step[cols], minlength=len(level)))[free]) / scale
+        # Loads a mechanism has to carry leave a residual no round removes
+        if balance >= residual:
+            break
+        displacement, residual = step, balance
+        if residual < 1e-12:
+            break
+    displacement = displacement.reshape(-1, 3)
+
+    direction = (verts[edges[:, 1]] - verts[edges[:, 0]]) / lengths[:, None]
+    stretch = np.einsum("nc,nc->n", displacement[edges[:, 1]] - displacement[edges[:, 0]], direction)
+    return displacement, axial * stretch, residual, factors[3] // 3
+
+def analyze_truss(obj, modulus, diameter, wall, density, point_load, support_band, sections=None, max_bytes=0, tolerance=1e-6):
+    # Edges of the object's own mesh in world space are the struts, modifiers are not applied so
+    # the results line up with the edges they are written to. Vertices within support_band of
+    # the lowest one are pinned and selected vertices carry the point load. Results go back as
+    # mesh attributes, unstable frames raise before anything is written
+    mesh = obj.data
+    verts, edges = read_mesh_arrays(mesh)
+    if not len(edges):
+        raise ValueError("%s has no edges to analyse" % obj.name)
+    matrix = np.array(obj.matrix_world)
+    verts = verts @ matrix[:3, :3].T + matrix[:3, 3]
+    lengths = np.linalg.norm(verts[edges[:, 1]] - verts[edges[:, 0]], axis=1)
+    if (lengths <= 0).any():
+        raise ValueError("%s has zero length edges, weld it first" % obj.name)
+    groups = strut_groups(lengths)
+
+    # A FLOAT edge attribute strut_area (m^2) overrides the group sections per strut
+    attr = mesh.attributes.get("strut_area")
+    if attr is not None and attr.domain == 'EDGE' and attr.data_type == 'FLOAT':
+        area = np.empty(len(edges), dtype=np.float32)
+        attr.data.foreach_get("value", area)
+        area = area.astype(np.float64)
+    else:
+        area = section_areas(groups, diameter, wall, sections or {})
+
+    low = verts[:, 2].min()
+    fixed = verts[:, 2] <= low + support_band + 1e-9 * max(np.ptp(verts[:, 2]), 1e-12)
+    loads = np.zeros_like(verts)
+    selected = np.zeros(len(verts), dtype=bool)
+    mesh.vertices.foreach_get("select", selected)
+    loads[selected & ~fixed, 2] -= point_load
+
+    displacement, force, residual, mechanisms = truss_analysis(verts, edges, area, modulus, fixed, density, loads, max_bytes)
+    if residual > tolerance:
+        if len(mechanisms):
+            raise ValueError(
+                "Unstable frame: %d mechanisms the loads set moving, the first at vertex %d. "
+                "Triangulate or brace the faces, or widen the support band" % (len(mechanisms), mechanisms[0]))
+        raise ValueError("Solver residual %.1e, the frame is close to a mechanism" % residual)
+    set_attribute(mesh, "axial_force", force, 'FLOAT', 'EDGE')
+    set_attribute(mesh, "strut_group", groups, 'INT', 'EDGE')
+    set_attribute(mesh, "deflection", np.linalg.norm(displacement, axis=1), 'FLOAT', 'POINT')
+    mesh.update()
+    obj["zonohedron_max_deflection"] = float(np.linalg.norm(displacement, axis=1).max())
+    obj["zonohedron_max_tension"] = float(max(force.max(), 0.0))
+    obj["zonohedron_max_compression"] = float(max(-force.min(), 0.0))
+    return displacement, force, mechanisms
+
+# --- Zones ---
+def read_face_attribute(mesh, name):
+    attr = mesh.attributes.get(name)
+    if attr is None or attr.domain != 'FACE' or attr.data_type != 'INT':
+        return None
+    values = np.empty(len(mesh.polygons), dtype=np.int32)
+    attr.data.foreach_get("value", values)
+    return values
+
+def select_faces(mesh, selected):
+    # Faces, and the vertices and edges they use, in bulk
+    _, loop_total, loops = read_mesh_faces(mesh)
+    verts = np.zeros(len(mesh.vertices), dtype=bool)
+    verts[loops[np.repeat(selected, loop_total)]] = True
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edges)
+    mesh.polygons.foreach_set("select", selected)
+    mesh.vertices.foreach_set("select", verts)
+    mesh.edges.foreach_set("select", verts[edges].reshape(-1, 2).all(axis=1))
+    mesh.update()
+
+def select_zone(obj, attribute, value=-1, extend=False):
+    # Select every face whose attribute equals value, -1 takes the value of the active face
+    mesh = obj.data
+    values = read_face_attribute(mesh, attribute)
+    if values is None:
+        raise ValueError("%s has no %s attribute, make it again to record zones" % (obj.name, attribute))
+    if value < 0:
+        if not 0 <= mesh.polygons.active < len(values):
+            raise ValueError("No active face to take the zone from")
+        value = values[mesh.polygons.active]
+    selected = values == value
+    if extend:
+        current = np.empty(len(mesh.polygons), dtype=bool)
+        mesh.polygons.foreach_get("select", current)
+        selected |= current
+    select_faces(mesh, selected)
+    return int(value), int(selected.sum())
+
+def color_zones(obj, attribute):
+    # One material per zone, assigned through material_index in one pass
+    mesh = obj.data
+    values = read_face_attribute(mesh, attribute)
+    if values is None:
+        raise ValueError("%s has no %s attribute, make it again to record zones" % (obj.name, attribute))
+    count = int(values.max()) + 1 if len(values) else 0
+    mesh.materials.clear()
+    for i in range(count):
+        name = "%s_%02d" % (attribute, i)
+        material = bpy.data.materials.get(name) or bpy.data.materials.new(name)
+        # Golden ratio hue steps keep neighbouring zones apart
+        material.diffuse_color = colorsys.hsv_to_rgb((i * 0.618034) % 1, 0.6, 0.9) + (1,)
+        mesh.materials.append(material)
+    mesh.polygons.foreach_set("material_index", values)
+    mesh.update()
+    return count
+
+# --- Shape key animation ---
+# Every frame is written as an absolute shape key and a driver walks eval_time through them,
+# so playback needs no regeneration. The rest shape stays the finished design
+BAKE_KEY_SPACING = 10  # eval_time between absolute keys, Blender's own spacing
+
+def ease(t):
+    return t * t * (3 - 2 * t)
+
+def generator_frames(params, mode, blends):
+    # Vertices of the recipe's run topology for each blend, from generators changed per mode
+    params = normalize_params(params)
+    if params.zono_type not in ('standard', 'spirallohedra'):
+        raise ValueError("Generator animations need a standard or spirallohedra recipe")
+    keys, _ = zonohedron_runs(params)
+    final = zonohedron_generators(params) * (-1, -1, 1)
+
+    def place(verts, reference):
+        # Scaled, mirrored and centred like a fresh build of reference
+        low, high = reference.min(axis=0), reference.max(axis=0)
+        verts = verts * (params.width / (high[0] - low[0]))
+        centre = (low + high) / 2 * (params.width / (high[0] - low[0]))
+        if params.rotation_clockwise:
+            verts *= (-1, 1, 1)
+            centre *= (-1, 1, 1)
+        return verts - centre
+
+    if mode == 'DETAIL':
+        if params.detail == 1:
+            raise ValueError("Detail morphs need a spirallohedra recipe with detail above 1")
+        # Standard chords split into detail equal parts blend into the spiral chords
+        start = np.repeat(zonohedron_generators(replace(params, detail=1)) / params.detail, params.detail, axis=0)
+        start *= (-1, -1, 1)
+        # Vertices are linear in the generators, so every frame is one multiply add
+        origin = run_vertices(keys, start)
+        delta = run_vertices(keys, final - start)
+        for blend in blends:
+            verts = origin + delta * blend
+            yield place(verts, verts)
+        return
+
+    # Growth keeps the finished solid's placement, so the lowest vertex stays put
+    finished = run_vertices(keys, final)
+    if mode == 'EXTRUDE':
+        # Chords switch on one after another along the arm, every arm extrudes from the lowest vertex
+        steps = np.arange(len(final))
+        for blend in blends:
+            weights = np.clip(blend * len(final) - steps, 0, 1)
+            yield place(run_vertices(keys, final * weights[:, None]), finished)
+    elif mode == 'UNFOLD':
+        # Every edge is a chord, so keeping chord lengths while they lift from the
+        # horizontal unfolds the solid from a flat disc with rigid struts
+        length = np.linalg.norm(final, axis=1)
+        across = np.maximum(np.linalg.norm(final[:, :2], axis=1), 1e-300)
+        elevation = np.arctan2(final[:, 2], across)
+        for blend in blends:
+            angle = elevation * blend
+            chords = np.column_stack((final[:, :2] * (length * np.cos(angle) / across)[:, None], length * np.sin(angle)))
+            yield place(run_vertices(keys, chords), finished)
+    else:
+        raise ValueError("Unknown animation %s" % mode)
+
+def morph_frames(verts, mode, count, start=0.0, params=None):
+    # (n, 3) vertices for each of count frames, ramping from start to the finished shape
+    ramp = start + (1 - start) * ease(np.linspace(0, 1, count))
+    frames = generator_frames(params, mode, ramp)
+    finished = next(generator_frames(params, mode, [1.0]))
+    # The object must still have the vertex order of its recipe
+    if finished.shape != verts.shape or np.abs(finished - verts).max() > 1e-4 * params.width:
+        raise ValueError("The mesh no longer matches its recipe, make it again to animate it")
+    yield from frames
+
+def bake_shape_keys(obj, mode, count, start=0.0, frame_start=1):
+    mesh = obj.data
+    if "zonohedron_recipe" not in obj:
+        raise ValueError("%s has no recipe to animate" % obj.name)
+    params = recipe_to_params(obj["zonohedron_recipe"])
+    if mesh.shape_keys is not None:
+        mesh.shape_keys.driver_remove("eval_time")
+        obj.shape_key_clear()
+    verts = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", verts)
+    frames = morph_frames(verts.reshape(-1, 3).astype(np.float64), mode, count, start, params)
+
+    obj.shape_key_add(name="Basis", from_mix=False)
+    mesh.shape_keys.use_relative = False
+    for i, coords in enumerate(frames):
+        block = obj.shape_key_add(name="%s_%03d" % (mode.lower(), i), from_mix=False)
+        block.interpolation = 'KEY_LINEAR'
+        block.data.foreach_set("co", coords.astype(np.float32).ravel())
+
+    # Frame f plays key f - frame_start + 1, holding the ends
+    driver = mesh.shape_keys.driver_add("eval_time").driver
+    driver.type = 'SCRIPTED'
+    driver.expression = "(min(max(frame - %d, 0), %d) + 1) * %d" % (frame_start, count - 1, BAKE_KEY_SPACING)
+    return count
+
+def read_mesh_arrays(mesh):
+    verts = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", verts)
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edges)
+    return verts.reshape(-1, 3).astype(np.float64), edges.reshape(-1, 2).astype(np.int64)
+
+def read_mesh_faces(mesh):
+    loop_start = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_start)
+    loop_total = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_total)
+    loops = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loops)
+    return loop_start.astype(np.int64), loop_total.astype(np.int64), loops.astype(np.int64)
+
+def set_face_attribute(mesh, name, values, data_type='INT'):
+    set_attribute(mesh, name, values, data_type, 'FACE')
+
+def set_attribute(mesh, name, values, data_type='INT', domain='FACE'):
+    attr = mesh.attributes.get(name)
+    if attr is None or attr.domain != domain or attr.data_type != data_type:
+        if attr is not None:
+            mesh.attributes.remove(attr)
+        attr = mesh.attributes.new(name, data_type, domain)
+    dtype = np.int32 if data_type == 'INT' else np.float32
+    attr.data.foreach_set("value", np.ascontiguousarray(values, dtype=dtype))
+
+def vertex_frames(dirs):
+    # dirs: (n, k, 3) unit edge directions for n vertices of valence k
+    axis = -dirs.mean(axis=1)
+    length = np.linalg.norm(axis, axis=1)
+    # Flat or balanced hubs have no preferred axis, use the normal of the first two struts
+    flat = length < 1e-6
+    if flat.any():
+        fallback = np.cross(dirs[flat, 0], dirs[flat, 1 % dirs.shape[1]])
+        fallback[np.linalg.norm(fallback, axis=1) < 1e-9] = (0, 0, 1)
+        axis[flat] = fallback
+        length[flat] = np.linalg.norm(fallback, axis=1)
+    return axis / length[:, None]
+
+def hub_signatures(verts, edges, precision=3):
+    # Group vertices by the shape of their incident struts
+    src = np.concatenate((edges[:, 0], edges[:, 1]))
+    dst = np.concatenate((edges[:, 1], edges[:, 0]))
+    order = np.argsort(src, kind="stable")
+    src, dst = src[order], dst[order]
+    dirs = verts[dst] - verts[src]
+    dirs /= np.linalg.norm(dirs, axis=1)[:, None]
+    valence = np.bincount(src, minlength=len(verts))
+    starts = np.concatenate(([0], np.cumsum(valence)[:-1]))
+    scale = 10 ** precision
+
+    keys = [None] * len(verts)
+    frames = np.zeros((len(verts), 4, 4))
+    local_dirs = [None] * len(verts)
+    for k in np.unique(valence):
+        if k == 0:
+            continue
+        idx = np.nonzero(valence == k)[0]
+        vdirs = dirs[starts[idx][:, None] + np.arange(k)]
+        z_axis = vertex_frames(vdirs)
+
+        # Try every strut as the x reference, keep the lexicographically smallest layout
+        proj = vdirs - (vdirs @ z_axis[:, :, None]) * z_axis[:, None, :]
+        proj_len = np.linalg.norm(proj, axis=2)
+        usable = proj_len > 1e-6
+        x_axes = proj / np.where(usable, proj_len, 1)[:, :, None]
+        y_axes = np.cross(z_axis[:, None, :], x_axes)
+        local = np.stack((
+            np.einsum("nkc,nsc->nsk", vdirs, x_axes),
+            np.einsum("nkc,nsc->nsk", vdirs, y_axes),
+            np.broadcast_to((vdirs @ z_axis[:, :, None])[:, None, :, 0], (len(idx), k, k)),
+        ), axis=3)
+        azimuth = np.mod(np.arctan2(local[..., 1], local[..., 0]), 2 * math.pi)
+        azimuth[np.abs(azimuth - 2 * math.pi) < 1e-9] = 0
+        sort = np.argsort(azimuth, axis=2, kind="stable")
+        local = np.take_along_axis(local, sort[..., None], axis=2)
+        quant = np.rint(local * scale).astype(np.int64).reshape(len(idx), k, k * 3)
+
+        candidates = usable.copy()
+        candidates[~candidates.any(axis=1), 0] = True
+        big = np.iinfo(np.int64).max
+        for col in range(k * 3):
+            column = np.where(candidates, quant[:, :, col], big)
+            candidates &= column == column.min(axis=1)[:, None]
+        best = candidates.argmax(axis=1)
+        rows = np.arange(len(idx))
+
+        frames[idx, :3, 0] = x_axes[rows, best]
+        frames[idx, :3, 1] = y_axes[rows, best]
+        frames[idx, :3, 2] = z_axis
+        frames[idx, :3, 3] = verts[idx]
+        frames[idx, 3, 3] = 1
+        chosen = quant[rows, best]
+        chosen_local = local[rows, best]
+        for n, v in enumerate(idx):
+            keys[v] = (int(k),) + tuple(chosen[n].tolist())
+            local_dirs[v] = chosen_local[n]
+
+    type_ids = {}
+    hub_types = np.full(len(verts), -1, dtype=np.int64)
+    representatives = []
+    for v, key in enumerate(keys):
+        if key is None:
+            continue
+        if key not in type_ids:
+            type_ids[key] = len(representatives)
+            representatives.append(local_dirs[v])
+        hub_types[v] = type_ids[key]
+    return hub_types, frames, representatives
+
+def create_hub_mesh(name, directions, radius, length, segments=6):
+    verts = [(0, 0, 0)]
+    faces = []
+    for d in directions:
+        d = np.asarray(d, dtype=np.float64)
+        helper = (1, 0, 0) if abs(d[0]) < 0.9 else (0, 1, 0)
+        u = np.cross(d, helper)
+        u /= np.linalg.norm(u)
+        w = np.cross(d, u)
+        base = len(verts)
+        for i in range(segments):
+            a = 2 * math.pi * i / segments
+            ring = (math.cos(a) * u + math.sin(a) * w) * radius
+            verts.append(tuple(ring))
+            verts.append(tuple(ring + d * length))
+        for i in range(segments):
+            j = (i + 1) % segments
+            faces.append([base + i * 2, base + j * 2, base + j * 2 + 1, base + i * 2 + 1])
+        faces.append([base + i * 2 + 1 for i in range(segments)])
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(verts, [], faces)
+    mesh.update()
+    return mesh
+
+def create_hubs(obj, radius, length):
+    verts, edges = read_mesh_arrays(obj.data)
+    verts = verts @ np.array(obj.matrix_world)[:3, :3].T + np.array(obj.matrix_world)[:3, 3]
+    hub_types, frames, representatives = hub_signatures(verts, edges)
+
+    collection = bpy.data.collections.new(obj.name + "Hubs")
+    bpy.context.scene.collection.children.link(collection)
+
+    counts = np.bincount(hub_types[hub_types >= 0], minlength=len(representatives))
+    meshes = []
+    for t, directions in enumerate(representatives):
+        mesh = create_hub_mesh("%sHub_%02d" % (obj.name, t), directions, radius, length)
+        mesh["hub_count"] = int(counts[t])
+        meshes.append(mesh)
+
+    # Every hub of a type links the same mesh data
+    for v in np.nonzero(hub_types >= 0)[0]:
+        t = hub_types[v]
+        hub = bpy.data.objects.new(meshes[t].name, meshes[t])
+        hub.matrix_world = Matrix(frames[v].tolist())
+        collection.objects.link(hub)
+
+    obj["zonohedron_hub_counts"] = {m.name: int(c) for m, c in zip(meshes, counts)}
+    return counts
+
+# --- Panel classification ---
+def face_normals(pts):
+    # Newell normal and centre of a stack of n-gons, pts: (faces, n, 3)
+    center = pts.mean(axis=1)
+    normal = np.cross(pts - center[:, None], np.roll(pts, -1, axis=1) - center[:, None]).sum(axis=1)
+    normal /= np.linalg.norm(normal, axis=1)[:, None]
+    return normal, center
+
+def canonical_layouts(pts, tolerance, windings=(1, -1)):
+    # Canonical in-plane layout, trying every start vertex in each winding
+    count, n = pts.shape[:2]
+    normal, center = face_normals(pts)
+    starts = np.tile(np.arange(n), len(windings))
+    winding = np.repeat(windings, n)
+    order = (starts[:, None] + winding[:, None] * np.arange(n)) % n
+    cand = pts[:, order] - center[:, None, None]
+    x_axes = cand[:, :, 0] - (cand[:, :, 0] @ normal[:, :, None]) * normal[:, None]
+    x_axes /= np.linalg.norm(x_axes, axis=2)[:, :, None]
+    y_axes = np.cross(normal[:, None] * winding[None, :, None], x_axes)
+    local = np.stack((
+        np.einsum("nskc,nsc->nsk", cand, x_axes),
+        np.einsum("nskc,nsc->nsk", cand, y_axes),
+    ), axis=3)
+    quant = np.rint(local / tolerance).astype(np.int64).reshape(count, len(order), 2 * n)
+
+    candidates = np.ones((count, len(order)), dtype=bool)
+    big = np.iinfo(np.int64).max
+    for col in range(2 * n):
+        column = np.where(candidates, quant[:, :, col], big)
+        candidates &= column == column.min(axis=1)[:, None]
+    best = candidates.argmax(axis=1)
+    rows = np.arange(count)
+    return order[best], x_axes[rows, best], y_axes[rows, best], normal, center, quant[rows, best], local[rows, best]
+
+def classify_panels(verts, loop_start, loop_total, loops, tolerance=0.001):
+    # Faces are congruent when their sorted edge lengths and diagonals match
+    face_types = np.full(len(loop_start), -1, dtype=np.int64)
+    frames = np.zeros((len(loop_start), 4, 4))
+    layouts = [None] * len(loop_start)
+    hashes = [None] * len(loop_start)
+    for n in np.unique(loop_total):
+        if n < 3:
+            continue
+        idx = np.nonzero(loop_total == n)[0]
+        pts = verts[loops[loop_start[idx][:, None] + np.arange(n)]]
+        edges = np.linalg.norm(np.roll(pts, -1, axis=1) - pts, axis=2)
+        diagonals = np.linalg.norm(np.roll(pts, -2, axis=1) - pts, axis=2)
+        shape = np.concatenate((np.sort(edges, axis=1), np.sort(diagonals, axis=1)), axis=1)
+        shape = np.rint(shape / tolerance).astype(np.int64)
+
+        _, x_axis, y_axis, normal, center, chosen, chosen_local = canonical_layouts(pts, tolerance)
+        frames[idx, :3, 0] = x_axis
+        frames[idx, :3, 1] = y_axis
+        frames[idx, :3, 2] = normal
+        frames[idx, :3, 3] = center
+        frames[idx, 3, 3] = 1
+        for k, f in enumerate(idx):
+            hashes[f] = (int(n),) + tuple(shape[k].tolist())
+            layouts[f] = ((int(n),) + tuple(chosen[k].tolist()), chosen_local[k])
+
+    type_ids = {}
+    for f, key in enumerate(hashes):
+        if key is None:
+            continue
+        face_types[f] = type_ids.setdefault(key, len(type_ids))
+    return face_types, frames, layouts
+
+def create_panel_instances(obj, face_types, frames, layouts):
+    collection = bpy.data.collections.new(obj.name + "Panels")
+    bpy.context.scene.collection.children.link(collection)
+    matrix_world = np.array(obj.matrix_world)
+
+    # One mesh per panel layout, shared by every face of that layout
+    meshes = {}
+    for f in np.nonzero(face_types >= 0)[0]:
+        key, local = layouts[f]
+        mesh_key = (int(face_types[f]), key)
+        mesh = meshes.get(mesh_key)
+        if mesh is None:
+            mesh = bpy.data.meshes.new("%sPanel_%02d" % (obj.name, face_types[f]))
+            mesh.from_pydata([(x, y, 0) for x, y in local], [], [list(range(len(local)))])
+            mesh.update()
+            meshes[mesh_key] = mesh
+        panel = bpy.data.objects.new(mesh.name, mesh)
+        panel.matrix_world = Matrix((matrix_world @ frames[f]).tolist())
+        collection.objects.link(panel)
+    obj.hide_set(True)
+    return collection
+
+def classify_zonohedron_panels(obj, tolerance, instances=False):
+    mesh = obj.data
+    verts, _ = read_mesh_arrays(mesh)
+    loop_start, loop_total, loops = read_mesh_faces(mesh)
+    face_types, frames, layouts = classify_panels(verts, loop_start, loop_total, loops, tolerance)
+    set_face_attribute(mesh, "face_type", face_types)
+
+    counts = np.bincount(face_types[face_types >= 0])
+    obj["zonohedron_panel_counts"] = {"type_%02d" % t: int(c) for t, c in enumerate(counts)}
+    if instances:
+        create_panel_instances(obj, face_types, frames, layouts)
+    return counts
+
+# --- Panel solids ---
+def loop_frames(zmesh):
+    # Newell normal and centre of every face, plus the next loop of every loop
+    face = zmesh.face_index()
+    totals = zmesh.loop_total
+    following = np.arange(len(zmesh.loops)) + 1
+    following[zmesh.offsets[1:] - 1] = zmesh.offsets[:-1]
+    pts = zmesh.verts[zmesh.loops]
+    center = np.stack([np.bincount(face, pts[:, k], minlength=zmesh.face_count) for k in range(3)], axis=1)
+    center /= totals[:, None]
+    cross = np.cross(pts - center[face], pts[following] - center[face])
+    normal = np.stack([np.bincount(face, cross[:, k], minlength=zmesh.face_count) for k in range(3)], axis=1)
+    area = np.linalg.norm(normal, axis=1) / 2
+    normal /= np.maximum(2 * area, 1e-300)[:, None]
+    return normal, center, area, following
+
+def panel_solids(zmesh, thickness):
+    # Every face becomes a closed solid of the given thickness behind it. Each edge is cut on the
+    # plane bisecting the dihedral angle with the neighbouring face, square where there is none,
+    # so neighbouring panels meet on a shared mitre plane whatever the vertex valence
+    normal, center, area, following = loop_frames(zmesh)
+    face = zmesh.face_index()
+    # Outward is the side most of the surface faces away from the middle, open domes included
+    middle = np.average(center, axis=0, weights=area)
+    if np.einsum("nc,nc,n->", normal, center - middle, area) < 0:
+        normal = -normal
+
+    # Neighbouring loop across every edge, -1 on open edges and non manifold ones
+    a, b = zmesh.loops, zmesh.loops[following]
+    keys = np.minimum(a, b) * len(zmesh.verts) + np.maximum(a, b)
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    first = np.searchsorted(sorted_keys, sorted_keys, side="left")
+    last = np.searchsorted(sorted_keys, sorted_keys, side="right")
+    partner = np.full(len(keys), -1)
+    paired = last - first == 2
+    partner[order[paired]] = order[np.where(first == np.arange(len(keys)), first + 1, first)[paired]]
+
+    # Mitre plane normals, on the edge from each loop to the next
+    direction = zmesh.verts[b] - zmesh.verts[a]
+    square = np.cross(direction, normal[face])
+    mitre = np.where((partner >= 0)[:, None], normal[face] - normal[face[np.maximum(partner, 0)]], square)
+    flat = np.linalg.norm(mitre, axis=1) < 1e-6 * np.linalg.norm(square, axis=1)
+    mitre[flat] = square[flat]
+
+    # Each inner corner is a thickness behind its face on both mitre planes through the corner
+    previous = np.empty_like(following)
+    previous[following] = np.arange(len(following))
+    line = np.cross(mitre[previous], mitre)
+    depth = np.einsum("nc,nc->n", line, normal[face])
+    # Straight corners have parallel mitres and simply drop along the normal
+    straight = np.abs(depth) < 1e-9 * np.linalg.norm(line, axis=1).max(initial=1.0)
+    offset = -thickness * line / np.where(straight, 1.0, depth)[:, None]
+    offset[straight] = -thickness * normal[face[straight]]
+
+    # Outer loops keep their ids, inner loops follow them, sides are quads on every edge
+    count = len(zmesh.loops)
+    index = np.arange(count)
+    starts = np.repeat(zmesh.offsets[:-1], zmesh.loop_total)
+    ends = np.repeat(zmesh.offsets[1:], zmesh.loop_total)
+    inner = count + starts + ends - 1 - index
+    sides = np.stack((following, index, count + index, count + following), axis=1).ravel()
+    loops = np.concatenate((index, inner, sides))
+    totals = np.concatenate((zmesh.loop_total, zmesh.loop_total, np.full(count, 4)))
+    verts = np.concatenate((zmesh.verts[zmesh.loops], zmesh.verts[zmesh.loops] + offset))
+
+    solids = ZoneMesh(verts, loops, np.concatenate(([0], np.cumsum(totals))))
+    panel = np.concatenate((np.arange(zmesh.face_count), np.arange(zmesh.face_count), face))
+    # Surfaces wound inwards would give inside out solids
+    if np.einsum("nc,nc,n->", loop_frames(zmesh)[0], normal, area) < 0:
+        solids = mirror_faces(solids)
+    solids.face_attributes = {name: values[panel] for name, values in zmesh.face_attributes.items()}
+    solids.face_attributes["panel"] = panel
+    return solids
+
+def mirror_faces(zmesh):
+    # Same faces wound the other way
+    starts = np.repeat(zmesh.offsets[:-1], zmesh.loop_total)
+    ends = np.repeat(zmesh.offsets[1:], zmesh.loop_total)
+    return ZoneMesh(zmesh.verts, zmesh.loops[starts + ends - 1 - np.arange(len(zmesh.loops))], zmesh.offsets)
+
+def make_panel_solids(obj, thickness):
+    zmesh = read_zone_mesh(obj.data)
+    if not zmesh.face_count:
+        raise ValueError("%s has no faces to thicken" % obj.name)
+    zmesh.face_attributes = {name: values for name, values in zmesh.face_attributes.items() if values.dtype.kind in "iu"}
+    solids = panel_solids(zmesh, thickness)
+    collection = obj.users_collection[0] if obj.users_collection else None
+    panels = link_zone_mesh(solids, obj.name + "Panels", obj.data.name + "Panels", collection)
+    panels.matrix_world = obj.matrix_world.copy()
+    return panels, zmesh.face_count
+
+# --- Flat-pack layout ---
+def flat_panels(verts, loop_start, loop_total, loops, tolerance=0.001, unique=False):
+    # Every panel laid flat in its own plane: (face type, quantity, 2D corners)
+    face_types, _, layouts = classify_panels(verts, loop_start, loop_total, loops, tolerance)
+    faces = np.nonzero(face_types >= 0)[0]
+    quantities = np.ones(len(faces), dtype=np.int64)
+    if unique:
+        counts = np.bincount(face_types[faces])
+        _, first = np.unique(face_types[faces], return_index=True)
+        faces = faces[first]
+        quantities = counts[face_types[faces]]
+
+    panels = [None] * len(faces)
+    sizes = loop_total[faces]
+    for n in np.unique(sizes):
+        group = np.nonzero(sizes == n)[0]
+        pts = np.stack([layouts[faces[g]][1] for g in group])
+
+        # Lay the longest edge along x, then keep the panel wider than it is tall
+        edges = np.roll(pts, -1, axis=1) - pts
+        longest = np.linalg.norm(edges, axis=2).argmax(axis=1)
+        edge = edges[np.arange(len(group)), longest]
+        angle = -np.arctan2(edge[:, 1], edge[:, 0])
+        cos, sin = np.cos(angle)[:, None], np.sin(angle)[:, None]
+        pts = np.stack((pts[..., 0] * cos - pts[..., 1] * sin, pts[..., 0] * sin + pts[..., 1] * cos), axis=2)
+        span = pts.max(axis=1) - pts.min(axis=1)
+        tall = span[:, 1] > span[:, 0]
+        pts[tall] = pts[tall][..., ::-1] * (1, -1)
+        pts -= pts.min(axis=1)[:, None]
+        for k, g in enumerate(group):
+            panels[g] = (int(face_types[faces[g]]), int(quantities[g]), pts[k])
+    return panels
+
+def polygon_area(pts):
+    x, y = pts[:, 0], pts[:, 1]
+    return abs((x * np.roll(y, -1) - y * np.roll(x, -1)).sum()) / 2
+
+def shelf_pack(sizes, sheet_width, sheet_height, gap):
+    # Tallest panels first, filling shelves left to right and sheets top to bottom
+    placements = np.zeros((len(sizes), 3))
+    sheet, x, y, shelf_height = 0, gap, gap, 0.0
+    for i in np.argsort(-sizes[:, 1], kind="stable"):
+        width, height = sizes[i]
+        if width + 2 * gap > sheet_width or height + 2 * gap > sheet_height:
+            raise ValueError("Panel %d does not fit on the sheet" % i)
+        if x + width + gap > sheet_width:
+            x, y, shelf_height = gap, y + shelf_height + gap, 0.0
+        if y + height + gap > sheet_height:
+            sheet, x, y, shelf_height = sheet + 1, gap, gap, 0.0
+        placements[i] = (sheet, x, y)
+        x += width + gap
+        shelf_height = max(shelf_height, height)
+    return placements
+
+def write_svg_sheet(path, sheet_width, sheet_height, panels):
+    with open(path, "w") as f:
+        f.write('<svg xmlns="http://www.w3.org/2000/svg" width="%gmm" height="%gmm" viewBox="0 0 %g %g">\n'
+                % (sheet_width, sheet_height, sheet_width, sheet_height))
+        for face_type, quantity, pts in panels:
+            d = " ".join("%s%.3f %.3f" % ("M" if i == 0 else "L", x, y) for i, (x, y) in enumerate(pts))
+            f.write('<path d="%s Z" fill="none" stroke="#ff0000" stroke-width="0.1"/>\n' % d)
+            label = "T%02d" % face_type if quantity == 1 else "T%02d x%d" % (face_type, quantity)
+            cx, cy = pts.mean(axis=0)
+            f.write('<text x="%.3f" y="%.3f" font-size="3" text-anchor="middle" fill="#0000ff">%s</text>\n'
+                    % (cx, cy, label))
+        f.write("</svg>\n")
+
+def write_dxf_sheet(path, sheet_width, sheet_height, panels):
+    # Plain R12 polylines, read by every CAM package
+    with open(path, "w") as f:
+        f.write("0\nSECTION\n2\nENTITIES\n")
+        for face_type, quantity, pts in panels:
+            f.write("0\nPOLYLINE\n8\nCUT\n66\n1\n70\n1\n")
+            for x, y in pts:
+                # DXF y points up, flip so sheets match the SVG layout
+                f.write("0\nVERTEX\n8\nCUT\n10\n%.4f\n20\n%.4f\n30\n0.0\n" % (x, sheet_height - y))
+            f.write("0\nSEQEND\n8\nCUT\n")
+            cx, cy = pts.mean(axis=0)
+            label = "T%02d" % face_type if quantity == 1 else "T%02d x%d" % (face_type, quantity)
+            f.write("0\nTEXT\n8\nLABEL\n10\n%.4f\n20\n%.4f\n30\n0.0\n40\n3.0\n1\n%s\n"
+                    % (cx, sheet_height - cy, label))
+        f.write("0\nENDSEC\n0\nEOF\n")
+
+def export_flat_pack(obj, filepath, file_format, sheet_width, sheet_height, gap, scale, tolerance, unique):
+    mesh = obj.data
+    verts, _ = read_mesh_arrays(mesh)
+    verts = verts @ np.array(obj.matrix_world)[:3, :3].T
+    loop_start, loop_total, loops = read_mesh_faces(mesh)
+    panels = flat_panels(verts * scale, loop_start, loop_total, loops, tolerance * scale, unique)
+
+    sizes = np.array([pts.max(axis=0) for _, _, pts in panels]).reshape(-1, 2)
+    placements = shelf_pack(sizes, sheet_width, sheet_height, gap)
+    sheets = int(placements[:, 0].max()) + 1 if len(panels) else 0
+
+    writer = write_dxf_sheet if file_format == 'DXF' else write_svg_sheet
+    stem, ext = os.path.splitext(filepath)
+    paths = []
+    for sheet in range(sheets):
+        on_sheet = np.nonzero(placements[:, 0] == sheet)[0]
+        placed = [(panels[i][0], panels[i][1], panels[i][2] + placements[i, 1:]) for i in on_sheet]
+        path = "%s_%02d%s" % (stem, sheet + 1, ext)
+        writer(path, sheet_width, sheet_height, placed)
+        paths.append(path)
+
+    used = sum(polygon_area(pts) for _, _, pts in panels)
+    efficiency = used / (sheets * sheet_width * sheet_height) if sheets else 0
+    return paths, efficiency
+
+# --- SVG views ---
+def face_centroids(zmesh):
+    sums = np.add.reduceat(zmesh.verts[zmesh.loops], zmesh.offsets[:-1], axis=0)
+    return sums / zmesh.loop_total[:, None]
+
+def write_svg_view(path, shapes, order, size, fill, closed):
+    stroke = '#ddd'
+    with open(path, "w") as f:
+        f.write('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 %d %d">\n' % (size, size))
+        f.write('<rect id="background" width="100%" height="100%" fill="#2f628b" x="0" y="0"/>\n')
+        f.write('<g>\n')
+        for i in order:
+            d = " ".join("%s%.2f %.2f" % ("M" if k == 0 else "L", x, y) for k, (x, y) in enumerate(shapes[i]))
+            f.write('<path d="%s%s" fill="%s" stroke="%s" stroke-width="2"/>\n'
+                    % (d, " Z" if closed else "", fill if closed else "none", stroke))
+        f.write('</g>\n</svg>\n')
+
+def render_svg_views(zmesh, top_path, side_path, rotation=0, size=1200, fill='#123456'):
+    # Same views as the 2D pages: painter's order on polygon averages
+    angle = math.radians(rotation)
+    cos, sin = math.cos(angle), math.sin(angle)
+    verts = zmesh.verts @ np.array([[cos, sin, 0], [-sin, cos, 0], [0, 0, 1]])
+    scale = size * 0.6 / max(np.ptp(verts, axis=0).max(), 1e-12)
+    center = size / 2
+
+    if zmesh.face_count:
+        closed = True
+        average = face_centroids(ZoneMesh(verts, zmesh.loops, zmesh.offsets))
+        shapes = np.split(verts[zmesh.loops], zmesh.offsets[1:-1])
+    else:
+        closed = False
+        average = (verts[zmesh.edges[:, 0]] + verts[zmesh.edges[:, 1]]) / 2
+        shapes = list(verts[zmesh.edges])
+
+    top = [shape[:, :2] * scale + center for shape in shapes]
+    write_svg_view(top_path, top, np.argsort(-average[:, 2], kind="stable"), size, fill, closed)
+    side = [shape[:, ::2] * scale + center for shape in shapes]
+    write_svg_view(side_path, side, np.argsort(average[:, 1], kind="stable"), size, fill, closed)
+
+def render_catalog(params_list, out_dir, rotation=0, workers=None, zono=False):
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for params, zmesh in zip(params_list, build_zonohedra(params_list, workers)):
+        stem = os.path.join(out_dir, "%s_%d_%d_%d" % (params.zono_type, params.sides, params.detail, params.spirals))
+        render_svg_views(zmesh, stem + "_top.svg", stem + "_side.svg", rotation)
+        if zono and zmesh.face_count:
+            write_zono(stem + ".zono", zmesh.verts, zmesh.loops, zmesh.offsets, zmesh.face_attributes)
+        paths.append(stem)
+    return paths
+
+# --- Binary interchange ---
+# A .zono file is a 20 byte header (magic, version, flags, vertex, index and polygon counts),
+# then float32 xyz vertices, uint32 polygon indices, npolys + 1 uint32 offsets and, with
+# ZONO_FLAG_ZONES, one int32 array per zone attribute. Little endian and 4 byte aligned,
+# so numpy and JavaScript typed arrays both read the buffers where they lie
+ZONO_MAGIC = b"ZONO"
+ZONO_VERSION = 1
+ZONO_HEADER = struct.Struct("<4sHHIII")
+ZONO_FLAG_ZONES = 1
+
+def zono_buffers(verts, loops, offsets, attributes=None):
+    # Header and array views in file order, converting only arrays not already in the file dtype
+    zones = attributes and all(name in attributes for name in ZONE_ATTRIBUTES)
+    arrays = [
+        np.ascontiguousarray(verts, dtype="<f4"),
+        np.ascontiguousarray(loops, dtype="<u4"),
+        np.ascontiguousarray(offsets, dtype="<u4"),
+    ]
+    if zones:
+        arrays += [np.ascontiguousarray(attributes[name], dtype="<i4") for name in ZONE_ATTRIBUTES]
+    header = ZONO_HEADER.pack(
+        ZONO_MAGIC,
+        ZONO_VERSION,
+        ZONO_FLAG_ZONES if zones else 0,
+        len(arrays[0]),
+        len(arrays[1]),
+        len(arrays[2]) - 1
+    )
+    return [header] + [memoryview(array).cast("B") for array in arrays]
+
+def write_zono(path, verts, loops, offsets, attributes=None):
+    with open(path, "wb") as f:
+        for buffer in zono_buffers(verts, loops, offsets, attributes):
+            f.write(buffer)
+
+def zono_arrays(buffer):
+    # Views into buffer, nothing is copied
+    view = memoryview(buffer).cast("B")
+    if len(view) < ZONO_HEADER.size:
+        raise ValueError("File is too short for a ZONO header")
+    magic, version, flags, vert_count, index_count, poly_count = ZONO_HEADER.unpack_from(view)
+    if magic != ZONO_MAGIC:
+        raise ValueError("Not a ZONO file")
+    if version > ZONO_VERSION:
+        raise ValueError("ZONO version %d is newer than this add-on reads" % version)
+
+    sizes = [vert_count * 3, index_count, poly_count + 1]
+    if flags & ZONO_FLAG_ZONES:
+        sizes += [poly_count] * len(ZONE_ATTRIBUTES)
+    if ZONO_HEADER.size + sum(sizes) * 4 > len(view):
+        raise ValueError("ZONO file is truncated")
+    starts = ZONO_HEADER.size + np.concatenate(([0], np.cumsum(sizes))) * 4
+    dtypes = ["<f4", "<u4", "<u4"] + ["<i4"] * (len(sizes) - 3)
+    arrays = [np.frombuffer(view, dtype, size, start) for dtype, size, start in zip(dtypes, sizes, starts)]
+
+    verts, loops, offsets = arrays[0].reshape(-1, 3), arrays[1], arrays[2]
+    if offsets[0] != 0 or offsets[-1] != index_count or np.any(np.diff(offsets.astype(np.int64)) < 3):
+        raise ValueError("ZONO polygon offsets are inconsistent")
+    if index_count and loops.max() >= vert_count:
+        raise ValueError("ZONO polygon indices point past the vertices")
+    return verts, loops, offsets, dict(zip(ZONE_ATTRIBUTES, arrays[3:]))
+
+def read_zono(path):
+    # One read into a preallocated buffer, then views over it
+    buffer = bytearray(os.path.getsize(path))
+    with open(path, "rb") as f:
+        f.readinto(buffer)
+    return zono_arrays(buffer)
+
+def export_zono(obj, path):
+    mesh = obj.data
+    if not len(mesh.polygons):
+        raise ValueError("%s has no faces to export" % obj.name)
+    verts = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", verts)
+    loop_start = np.empty(len(mesh.polygons) + 1, dtype=np.uint32)
+    mesh.polygons.foreach_get("loop_start", loop_start[:-1])
+    loop_start[-1] = len(mesh.loops)
+    loops = np.empty(len(mesh.loops), dtype=np.uint32)
+    mesh.loops.foreach_get("vertex_index", loops)
+    attributes = {name: read_face_attribute(mesh, name) for name in ZONE_ATTRIBUTES}
+    attributes = {name: values for name, values in attributes.items() if values is not None}
+    write_zono(path, verts, loops, loop_start, attributes)
+    return len(loop_start) - 1
+
+def import_zono(path, collection=None):
+    verts, loops, offsets, attributes = read_zono(path)
+    name = os.path.splitext(os.path.basename(path))[0]
+    mesh = bpy.data.meshes.new(name)
+    # Same bits as int32 while the counts stay below 2**31, so Blender takes the views as they are
+    fill_mesh_buffers(mesh, verts, loops.view(np.int32), offsets.view(np.int32))
+    for attribute, values in attributes.items():
+        set_face_attribute(mesh, attribute, values)
+    obj = bpy.data.objects.new(name, mesh)
+    (collection or bpy.context.collection).objects.link(obj)
+    return obj
+
+# --- Golden geometry ---
+ENGINES = {
+    'default': build_zonohedron,
+    'reference': build_polygon_zonohedron,
+}
+
+# Presets with no three generators in one plane, which the reference faces need
+GOLDEN_GENERATORS = ('rhombic_dodecahedron', 'rhombic_triacontahedron', 'rhombic_enneacontahedron')
+GOLDEN_SIDES = range(3, 61)
+
+def golden_grid(sides=GOLDEN_SIDES, details=range(1, 7), spirals=range(1, 7), tolerances=(0.01, 0.001)):
+    for clockwise in (True, False):
+        for side in sides:
+            yield ZoneParams(sides=side, zono_type='standard', rotation_clockwise=clockwise)
+        for zono_type in ('spirallohedra', 'curved'):
+            for detail in details:
+                for side in sides:
+                    yield ZoneParams(sides=side, detail=detail, zono_type=zono_type, rotation_clockwise=clockwise)
+        for tolerance in tolerances:
+            for side in sides:
+                yield ZoneParams(sides=side, zono_type='curved', rotation_clockwise=clockwise, curve_tolerance=tolerance)
+        for spiral in spirals:
+            for side in sides:
+                yield ZoneParams(sides=side, zono_type='spiral', spirals=spiral, rotation_clockwise=clockwise)
+        for preset in GOLDEN_GENERATORS:
+            yield ZoneParams(zono_type='generators', rotation_clockwise=clockwise, generators=GENERATOR_PRESETS[preset])
+
+def geometry_hash(zmesh, tolerance, offset):
+    # Order independent: sorted snapped vertices and faces, each face from its smallest corner
+    snapped = np.rint(zmesh.verts / tolerance + offset).astype(np.int64)
+    digest = hashlib.sha1()
+    digest.update(np.ascontiguousarray(snapped[np.lexsort(snapped.T[::-1])]).tobytes())
+    faces = []
+    for f in range(zmesh.face_count):
+        corners = [tuple(c) for c in snapped[zmesh.loops[zmesh.offsets[f]:zmesh.offsets[f + 1]]].tolist()]
+        start = corners.index(min(corners))
+        faces.append(tuple(corners[start:] + corners[:start]))
+    edges = sorted(tuple(sorted(map(tuple, pair))) for pair in snapped[zmesh.edges].tolist())
+    digest.update(repr((sorted(faces), edges)).encode("utf-8"))
+    return digest.hexdigest()
+
+def geometry_signature(zmesh, tolerance=1e-5):
+    metrics = zmesh.metrics or zone_metrics(zmesh)
+    return {
+        "vertices": len(zmesh.verts),
+        "faces": zmesh.face_count,
+        "edges": len(zmesh.edges),
+        "low": zmesh.verts.min(axis=0).tolist(),
+        "high": zmesh.verts.max(axis=0).tolist(),
+        "volume": metrics["volume"],
+        "area": metrics["area"],
+        # Two grids half a cell apart, a true match agrees on at least one
+        "hash": [geometry_hash(zmesh, tolerance, 0.3183), geometry_hash(zmesh, tolerance, 0.8183)],
+    }
+
+def signature_differences(expected, actual, tolerance=1e-5):
+    differences = []
+    for key in ("vertices", "faces", "edges"):
+        if expected[key] != actual[key]:
+            differences.append("%s %d != %d" % (key, expected[key], actual[key]))
+    for key in ("low", "high"):
+        if not np.allclose(expected[key], actual[key], atol=tolerance):
+            differences.append("%s %s != %s" % (key, expected[key], actual[key]))
+    for key in ("volume", "area"):
+        if not math.isclose(expected[key], actual[key], rel_tol=1e-6, abs_tol=tolerance):
+            differences.append("%s %g != %g" % (key, expected[key], actual[key]))
+    if not set(expected["hash"]) & set(actual["hash"]):
+        differences.append("geometry hash")
+    return differences
+
+def record_golden(path, params_list, engine=build_polygon_zonohedron, tolerance=1e-5):
+    with open(path, "w") as f:
+        for params in params_list:
+            record = {"params": asdict(params)}
+            record.update(geometry_signature(engine(params), tolerance))
+            f.write(json.dumps(record) + "\n")
+
+def compare_golden(path, engine=build_zonohedron, tolerance=1e-5):
+    # Returns the first diverging parameter set and what differs, or None
+    with open(path) as f:
+        for line in f:
+            record = json.loads(line)
+            params = record.pop("params")
+            params = ZoneParams(**dict(params, generators=tuple(map(tuple, params["generators"]))))
+            differences = signature_differences(record, geometry_signature(engine(params), tolerance), tolerance)
+            if differences:
+                return params, differences
+    return None
+
+def cli_main(argv):
+    # blender -b -P zonohedron_blender_addon_2026.py -- --catalog DIR [options]
+    # blender -b -P zonohedron_blender_addon_2026.py -- --golden-record FILE | --golden-compare FILE
+    parser = argparse.ArgumentParser(prog="zonohedron")
+    action = parser.add_mutually_exclusive_group(required=True)
+    action.add_argument("--catalog", help="Output directory for the SVG views")
+    action.add_argument("--golden-record", help="Record reference geometry signatures to this file")
+    action.add_argument("--golden-compare", help="Compare an engine against recorded signatures")
+    parser.add_argument("--engine", choices=sorted(ENGINES), default=None)
+    parser.add_argument("--types", default="standard,spirallohedra,spiral,curved")
+    # Without a range the catalog covers 6 to 60 sides and the golden files GOLDEN_SIDES
+    parser.add_argument("--sides-min", type=int, default=None)
+    parser.add_argument("--sides-max", type=int, default=None)
+    parser.add_argument("--detail", type=int, default=1)
+    parser.add_argument("--spirals", type=int, default=1)
+    parser.add_argument("--rotation", type=float, default=0)
+    parser.add_argument("--zono", action="store_true", help="Also write a .zono file for every catalog entry")
+    args = parser.parse_args(argv)
+
+    if args.golden_record:
+        sides = range(
+            GOLDEN_SIDES.start if args.sides_min is None else args.sides_min,
+            GOLDEN_SIDES.stop if args.sides_max is None else args.sides_max + 1,
         )
-    return all_edges
-
-def draw_zonohedron():
-    if zoneData.zono_type == 'standard':
-        zoneData.detail = 1
-        result = create_zonohedron()
-        create_from_json_data(result, 'Zonohedron', 'ZonohedronMesh')
-    if zoneData.zono_type == 'spirallohedra':
-        result = create_zonohedron()
-        create_from_json_data(result, 'Spirallohedra', 'SpirallohedraMesh')
-    if zoneData.zono_type == 'spiral':
-        result = create_spiral_zonohedron()
-        create_from_json_data(result, 'ZonohedronSpiral', 'ZonohedronSpiralMesh')
-    if zoneData.zono_type == 'curved':
-        edge_data = create_curved_zonohedron()
-        result = create_edges_from_json_data(edge_data, 'ZonohedronCurved')
+        params_list = list(golden_grid(sides))
+        record_golden(args.golden_record, params_list, ENGINES[args.engine or 'reference'])
+        print("Recorded %d parameter sets to %s" % (len(params_list), args.golden_record))
+        return
+    if args.golden_compare:
+        divergence = compare_golden(args.golden_compare, ENGINES[args.engine or 'default'])
+        if divergence is None:
+            print("All parameter sets match %s" % args.golden_compare)
+        else:
+            print("First divergence at %s: %s" % divergence)
+            sys.exit(1)
+        return
+
+    params_list = [
+        ZoneParams(sides=sides, detail=args.detail, zono_type=zono_type, spirals=args.spirals)
+        for zono_type in args.types.split(",")
+        for sides in range(args.sides_min or 6, (args.sides_max or 60) + 1)
+    ]
+    paths = render_catalog(params_list, args.catalog, args.rotation, zono=args.zono)
+    print("Wrote %d zonohedron views to %s" % (len(paths) * 2, args.catalog))
 
 # --- Interface start ---
 class ZONO_PT_ZonohedronMaker(bpy.types.Panel):
@@ -450,96 +2742,919 @@ class ZONO_PT_ZonohedronMaker(bpy.types.Panel):
         sub_01 = col.column()
         sub_02 = col.column()
         sub_03 = col.column()
+        sub_04 = col.column()
         # General
         sub_01.prop(cs, "zonohedron_type")
         sub_01.prop(cs, "zonohedron_sides")
         sub_01.prop(cs, "zonohedron_width")
         sub_01.prop(cs, "zonohedron_reverse")
+        sub_01.prop(cs, "zonohedron_render_ready")
+        sub_01.prop(cs, "zonohedron_uv_scale")
         # Spiral
         sub_02.prop(cs, "zonohedron_spiral")
         # Curved
         sub_03.prop(context.scene, "zonohedron_detail")
+        sub_03b = col.column()
+        sub_03b.prop(cs, "zonohedron_adaptive")
+        sub_03b.prop(cs, "zonohedron_curve_tolerance")
+        # Generators
+        sub_04.prop(cs, "zonohedron_generator_preset")
+        sub_04.prop(cs, "zonohedron_generator_text")
         sub_02.enabled = True if cs.zonohedron_type == "spiral" else False
-        sub_03.enabled = True if cs.zonohedron_type != "standard" else False
+        sub_03.enabled = True if cs.zonohedron_type not in ("standard", "generators") else False
+        sub_04.enabled = True if cs.zonohedron_type == "generators" else False
+        sub_03b.enabled = True if cs.zonohedron_type == "curved" else False
+        # Cache
+        sub_05 = col.column()
+        sub_05.prop(cs, "zonohedron_cache")
+        sub_05.prop(cs, "zonohedron_cache_size")
+        sub_05.prop(cs, "zonohedron_parametric")
+        # Estimate
+        estimate = estimate_zonohedron(ZoneParams.from_scene(cs))
+        box = col.box()
+        box.alert = estimate["memory"] > cs.zonohedron_budget * 1024 * 1024
+        box.label(text="%d verts, %d faces, %d edges" % (estimate["vertices"], estimate["faces"], estimate["edges"]))
+        box.label(text="About %.1f MB" % (estimate["memory"] / 1024 / 1024))
+        box.prop(cs, "zonohedron_budget")
+        box.prop(cs, "zonohedron_budget_mode")
         col.operator("mesh.make_zonohedron", text="Make Zonohedron")
+        row = col.row()
+        row.operator("mesh.update_zonohedron", text="Update Selected")
+        row.prop(cs, "zonohedron_live_update")
+        # Metrics
+        obj = context.active_object
+        if obj is not None and "zonohedron_dimensions" in obj:
+            box = col.box()
+            box.label(text="Size: %.3f x %.3f x %.3f" % tuple(obj["zonohedron_dimensions"]))
+            if obj["zonohedron_area"]:
+                box.label(text="Volume: %.4f" % obj["zonohedron_volume"])
+                box.label(text="Area: %.4f" % obj["zonohedron_area"])
+            else:
+                box.label(text="Edge Length: %.4f" % obj["zonohedron_edge_length"])
+        # Array
+        sub_06 = col.column(align=True)
+        sub_06.prop(cs, "zonohedron_array_min")
+        sub_06.prop(cs, "zonohedron_array_max")
+        sub_06.prop(cs, "zonohedron_array_step")
+        sub_06.prop(cs, "zonohedron_array_spacing")
+        sub_06.operator("mesh.make_zonohedron_array", text="Make Array")
+        # Hubs
+        sub_07 = col.column()
+        sub_07.prop(cs, "zonohedron_hub_radius")
+        sub_07.prop(cs, "zonohedron_hub_length")
+        sub_07.operator("mesh.make_zonohedron_hubs", text="Make Hubs")
+        # Panels
+        sub_08 = col.column()
+        sub_08.prop(cs, "zonohedron_panel_tolerance")
+        sub_08.prop(cs, "zonohedron_panel_instances")
+        sub_08.operator("mesh.classify_zonohedron_panels", text="Classify Panels")
+        sub_08.operator("export_mesh.zonohedron_flat_pack", text="Export Cutting Layout")
+        sub_08.prop(cs, "zonohedron_panel_thickness")
+        sub_08.operator("mesh.make_zonohedron_panels", text="Make Panel Solids")
+        # Zones
+        sub_10 = col.column()
+        sub_10.prop(cs, "zonohedron_zone_attribute")
+        sub_10.prop(cs, "zonohedron_zone_value")
+        sub_10.prop(cs, "zonohedron_zone_extend")
+        row = sub_10.row()
+        row.operator("mesh.select_zonohedron_zone", text="Select Zone")
+        row.operator("mesh.color_zonohedron_zones", text="Color Zones")
+        # Planarity
+        sub_09 = col.column()
+        sub_09.prop(cs, "zonohedron_planarity_tolerance")
+        sub_09.prop(cs, "zonohedron_triangulate")
+        sub_09.operator("mesh.check_zonohedron_planarity", text="Check Planarity")
+        # Truncation
+        sub_12 = col.column()
+        sub_12.prop(cs, "zonohedron_truncate_height")
+        sub_12.prop(cs, "zonohedron_truncate_keep")
+        sub_12.prop(cs, "zonohedron_truncate_cap")
+        sub_12.operator("mesh.truncate_zonohedron", text="Truncate Selected")
+        # Truss analysis
+        sub_13 = col.column()
+        sub_13.prop(cs, "zonohedron_truss_modulus")
+        sub_13.prop(cs, "zonohedron_truss_diameter")
+        sub_13.prop(cs, "zonohedron_truss_wall")
+        sub_13.prop(cs, "zonohedron_truss_density")
+        sub_13.prop(cs, "zonohedron_truss_point_load")
+        sub_13.prop(cs, "zonohedron_truss_support_band")
+        sub_13.prop(cs, "zonohedron_truss_sections")
+        sub_13.operator("mesh.analyze_zonohedron_truss", text="Analyse Truss")
+        # Animation
+        sub_14 = col.column()
+        sub_14.prop(cs, "zonohedron_bake_mode")
+        sub_14.prop(cs, "zonohedron_bake_frames")
+        sub_14.prop(cs, "zonohedron_bake_start")
+        sub_14.operator("mesh.bake_zonohedron_shape_keys", text="Bake Shape Keys")
+        # Interchange
+        sub_11 = col.row()
+        sub_11.operator("import_mesh.zonohedron_zono", text="Import ZONO")
+        sub_11.operator("export_mesh.zonohedron_zono", text="Export ZONO")
 
 class MakeZonohedron(bpy.types.Operator):
     bl_idname = "mesh.make_zonohedron"
     bl_label = "Add Zonohedron"
     bl_options = {"UNDO"}
 
+    _task = None
+    _timer = None
+
     def invoke(self, context, event):
+        wm = context.window_manager
+        params, note = apply_budget(context.scene, ZoneParams.from_scene(context.scene))
+        if note:
+            self.report({'WARNING'}, note)
+        if params is None:
+            return {"CANCELLED"}
+        self._task = GenerationTask(params, *cache_settings(context.scene))
+        self._task.start()
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.progress_begin(0, 100)
+        wm.modal_handler_add(self)
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context, event):
+        task = self._task
+        if event.type == 'ESC':
+            task.cancelled = True
+            self.finish(context)
+            self.report({'INFO'}, "Zonohedron cancelled")
+            return {"CANCELLED"}
+        if event.type != 'TIMER':
+            return {"PASS_THROUGH"}
+
+        if not task.done():
+            percent = int(task.progress * 100)
+            context.window_manager.progress_update(percent)
+            context.workspace.status_text_set("Zonohedron: %d%% (Esc to cancel)" % percent)
+            return {"RUNNING_MODAL"}
+
+        self.finish(context)
+        if task.error is not None:
+            self.report({'ERROR'}, "Zonohedron failed: %s" % task.error)
+            return {"CANCELLED"}
+        # Only the mesh upload happens on the main thread
+        uv_scale = context.scene.zonohedron_uv_scale if context.scene.zonohedron_render_ready else None
+        if uv_scale is not None:
+            add_render_data(task.result, uv_scale)
+        link_zonohedron(task.result, task.params, uv_scale)
+        return {"FINISHED"}
+
+    def finish(self, context):
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        context.workspace.status_text_set(None)
+
+class UpdateZonohedron(bpy.types.Operator):
+    bl_idname = "mesh.update_zonohedron"
+    bl_label = "Update Zonohedron"
+    bl_options = {"UNDO"}
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        # Rebuilding would leave baked shape keys with the old vertices
+        return obj is not None and obj.type == 'MESH' and "zonohedron_recipe" in obj and obj.data.shape_keys is None
+
+    def execute(self, context):
+        cs = context.scene
+        params, note = apply_budget(cs, ZoneParams.from_scene(cs))
+        if note:
+            self.report({'WARNING'}, note)
+        if params is None:
+            return {"CANCELLED"}
+        update_zonohedron(
+            context.active_object,
+            params,
+            cs.zonohedron_uv_scale if cs.zonohedron_render_ready else None
+        )
+        return {"FINISHED"}
+
+class MakeZonohedronArray(bpy.types.Operator):
+    bl_idname = "mesh.make_zonohedron_array"
+    bl_label = "Add Zonohedron Array"
+    bl_options = {"UNDO"}
+
+    def execute(self, context):
+        cs = context.scene
+        sides_range = range(cs.zonohedron_array_min, cs.zonohedron_array_max + 1, cs.zonohedron_array_step)
+        objects = draw_zonohedron_array(
+            ZoneParams.from_scene(cs),
+            sides_range,
+            cs.zonohedron_array_spacing * cs.zonohedron_width,
+            *cache_settings(cs),
+            uv_scale=cs.zonohedron_uv_scale if cs.zonohedron_render_ready else None,
+            budget=lambda params: apply_budget(cs, params)[0]
+        )
+        self.report({'INFO'}, "%d zonohedra added" % len(objects))
+        return {"FINISHED"}
+
+class MakeZonohedronHubs(bpy.types.Operator):
+    bl_idname = "mesh.make_zonohedron_hubs"
+    bl_label = "Make Zonohedron Hubs"
+    bl_options = {"UNDO"}
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj is not None and obj.type == 'MESH'
+
+    def execute(self, context):
+        cs = context.scene
+        counts = create_hubs(context.active_object, cs.zonohedron_hub_radius, cs.zonohedron_hub_length)
+        summary = ", ".join("type %d x%d" % (t, c) for t, c in enumerate(counts))
+        self.report({'INFO'}, "%d hubs, %d types: %s" % (counts.sum(), len(counts), summary))
+        return {"FINISHED"}
+
+class ClassifyZonohedronPanels(bpy.types.Operator):
+    bl_idname = "mesh.classify_zonohedron_panels"
+    bl_label = "Classify Zonohedron Panels"
+    bl_options = {"UNDO"}
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj is not None and obj.type == 'MESH'
+
+    def execute(self, context):
+        cs = context.scene
+        counts = classify_zonohedron_panels(
+            context.active_object,
+            cs.zonohedron_panel_tolerance,
+            cs.zonohedron_panel_instances
+        )
+        summary = ", ".join("type %d x%d" % (t, c) for t, c in enumerate(counts))
+        self.report({'INFO'}, "%d panels, %d types: %s" % (counts.sum(), len(counts), summary))
+        return {"FINISHED"}
+
+class TruncateZonohedron(bpy.types.Operator):
+    bl_idname = "mesh.truncate_zonohedron"
+    bl_label = "Truncate Zonohedron"
+    bl_options = {"UNDO"}
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj is not None and obj.type == 'MESH' and obj.mode == 'OBJECT'
+
+    def execute(self, context):
+        cs = context.scene
+        try:
+            before, after = truncate_zonohedron(
+                context.active_object,
+                cs.zonohedron_truncate_height,
+                cs.zonohedron_truncate_keep,
+                cs.zonohedron_truncate_cap
+            )
+        except ValueError as error:
+            self.report({'ERROR'}, str(error))
+            return {"CANCELLED"}
+        self.report({'INFO'}, "%d faces cut to %d" % (before, after))
+        return {"FINISHED"}
+
+class AnalyzeZonohedronTruss(bpy.types.Operator):
+    bl_idname = "mesh.analyze_zonohedron_truss"
+    bl_label = "Analyse Zonohedron Truss"
+    bl_options = {"UNDO"}
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj is not None and obj.type == 'MESH' and obj.mode == 'OBJECT'
+
+    def execute(self, context):
+        cs = context.scene
+        try:
+            displacement, force, mechanisms = analyze_truss(
+                context.active_object,
+                cs.zonohedron_truss_modulus * 1e9,
+                cs.zonohedron_truss_diameter / 1000,
+                cs.zonohedron_truss_wall / 1000,
+                cs.zonohedron_truss_density,
+                cs.zonohedron_truss_point_load,
+                cs.zonohedron_truss_support_band,
+                scene_sections(cs),
+                cs.zonohedron_budget * 1024 * 1024
+            )
+        except ValueError as error:
+            self.report({'ERROR'}, str(error))
+            return {"CANCELLED"}
+        if len(mechanisms):
+            self.report({'WARNING'}, "%d mechanisms carry no load, the first at vertex %d" % (len(mechanisms), mechanisms[0]))
+        self.report({'INFO'}, "Max deflection %.2f mm, axial force %.0f to %.0f N" % (
+            np.linalg.norm(displacement, axis=1).max() * 1000, force.min(), force.max()))
+        return {"FINISHED"}
+
+class MakeZonohedronPanels(bpy.types.Operator):
+    bl_idname = "mesh.make_zonohedron_panels"
+    bl_label = "Make Zonohedron Panel Solids"
+    bl_options = {"UNDO"}
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj is not None and obj.type == 'MESH' and obj.mode == 'OBJECT'
+
+    def execute(self, context):
+        try:
+            panels, count = make_panel_solids(context.active_object, context.scene.zonohedron_panel_thickness)
+        except ValueError as error:
+            self.report({'ERROR'}, str(error))
+            return {"CANCELLED"}
+        self.report({'INFO'}, "%d panel solids in %s" % (count, panels.name))
+        return {"FINISHED"}
+
+class BakeZonohedronShapeKeys(bpy.types.Operator):
+    bl_idname = "mesh.bake_zonohedron_shape_keys"
+    bl_label = "Bake Zonohedron Shape Keys"
+    bl_options = {"UNDO"}
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj is not None and obj.type == 'MESH' and obj.mode == 'OBJECT'
+
+    def execute(self, context):
         cs = context.scene
-        zoneData.sides = cs.zonohedron_sides
-        zoneData.width = cs.zonohedron_width #size
-        zoneData.detail = cs.zonohedron_detail
-        zoneData.zono_type = cs.zonohedron_type
-        zoneData.spirals = cs.zonohedron_spiral
-        zoneData.rotation_clockwise = cs.zonohedron_reverse
-        draw_zonohedron()
+        try:
+            count = bake_shape_keys(
+                context.active_object,
+                cs.zonohedron_bake_mode,
+                cs.zonohedron_bake_frames,
+                cs.zonohedron_bake_start,
+                cs.frame_start
+            )
+        except ValueError as error:
+            self.report({'ERROR'}, str(error))
+            return {"CANCELLED"}
+        self.report({'INFO'}, "%d shape keys baked from frame %d" % (count, cs.frame_start))
+        return {"FINISHED"}
+
+class SelectZonohedronZone(bpy.types.Operator):
+    bl_idname = "mesh.select_zonohedron_zone"
+    bl_label = "Select Zonohedron Zone"
+    bl_options = {"UNDO"}
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj is not None and obj.type == 'MESH'
+
+    def execute(self, context):
+        cs = context.scene
+        # Mesh data only holds the selection outside edit mode
+        mode = context.active_object.mode
+        if mode == 'EDIT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+        try:
+            value, count = select_zone(
+                context.active_object,
+                cs.zonohedron_zone_attribute,
+                cs.zonohedron_zone_value,
+                cs.zonohedron_zone_extend
+            )
+        except ValueError as error:
+            self.report({'ERROR'}, str(error))
+            return {"CANCELLED"}
+        finally:
+            if mode == 'EDIT':
+                bpy.ops.object.mode_set(mode='EDIT')
+        self.report({'INFO'}, "%d faces in zone %d" % (count, value))
+        return {"FINISHED"}
+
+class ColorZonohedronZones(bpy.types.Operator):
+    bl_idname = "mesh.color_zonohedron_zones"
+    bl_label = "Color Zonohedron Zones"
+    bl_options = {"UNDO"}
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj is not None and obj.type == 'MESH'
+
+    def execute(self, context):
+        try:
+            count = color_zones(context.active_object, context.scene.zonohedron_zone_attribute)
+        except ValueError as error:
+            self.report({'ERROR'}, str(error))
+            return {"CANCELLED"}
+        self.report({'INFO'}, "%d zone materials assigned" % count)
+        return {"FINISHED"}
+
+class CheckZonohedronPlanarity(bpy.types.Operator):
+    bl_idname = "mesh.check_zonohedron_planarity"
+    bl_label = "Check Zonohedron Planarity"
+    bl_options = {"UNDO"}
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj is not None and obj.type == 'MESH'
+
+    def execute(self, context):
+        cs = context.scene
+        deviation, warped = check_planarity(
+            context.active_object,
+            cs.zonohedron_planarity_tolerance,
+            cs.zonohedron_triangulate
+        )
+        action = "triangulated" if cs.zonohedron_triangulate else "over tolerance"
+        self.report({'INFO'}, "Largest deviation %.6f, %d of %d faces %s" % (
+            deviation.max() if len(deviation) else 0.0, warped, len(deviation), action))
+        return {"FINISHED"}
+
+class ExportZonohedronFlatPack(bpy.types.Operator, ExportHelper):
+    bl_idname = "export_mesh.zonohedron_flat_pack"
+    bl_label = "Export Cutting Layout"
+
+    filename_ext = ".svg"
+    filter_glob: bpy.props.StringProperty(default="*.svg;*.dxf", options={'HIDDEN'})
+    file_format: bpy.props.EnumProperty(
+        name="Format",
+        items=(('SVG', 'SVG', 'Scalable Vector Graphics'),
+               ('DXF', 'DXF', 'AutoCAD R12 DXF'),
+               )
+    )
+    sheet_width: bpy.props.FloatProperty(name="Sheet Width (mm)", min=1, default=2440)
+    sheet_height: bpy.props.FloatProperty(name="Sheet Height (mm)", min=1, default=1220)
+    gap: bpy.props.FloatProperty(name="Gap (mm)", min=0, default=5)
+    scale: bpy.props.FloatProperty(name="Millimetres per Unit", min=0.001, default=1000)
+    unique: bpy.props.BoolProperty(
+        name="One per Type",
+        description="Lay out one panel per congruent type, labelled with its quantity",
+        default=False,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj is not None and obj.type == 'MESH'
+
+    def check(self, context):
+        self.filename_ext = ".dxf" if self.file_format == 'DXF' else ".svg"
+        return super().check(context)
+
+    def execute(self, context):
+        try:
+            paths, efficiency = export_flat_pack(
+                context.active_object,
+                self.filepath,
+                self.file_format,
+                self.sheet_width,
+                self.sheet_height,
+                self.gap,
+                self.scale,
+                context.scene.zonohedron_panel_tolerance,
+                self.unique
+            )
+        except ValueError as error:
+            self.report({'ERROR'}, str(error))
+            return {"CANCELLED"}
+        self.report({'INFO'}, "%d sheets written, %.0f%% material used" % (len(paths), efficiency * 100))
+        return {"FINISHED"}
+
+class ImportZonohedronZono(bpy.types.Operator, ImportHelper):
+    bl_idname = "import_mesh.zonohedron_zono"
+    bl_label = "Import ZONO"
+    bl_options = {"UNDO"}
+
+    filename_ext = ".zono"
+    filter_glob: bpy.props.StringProperty(default="*.zono", options={'HIDDEN'})
+
+    def execute(self, context):
+        try:
+            obj = import_zono(self.filepath)
+        except (OSError, ValueError) as error:
+            self.report({'ERROR'}, str(error))
+            return {"CANCELLED"}
+        self.report({'INFO'}, "%d faces imported" % len(obj.data.polygons))
+        return {"FINISHED"}
+
+class ExportZonohedronZono(bpy.types.Operator, ExportHelper):
+    bl_idname = "export_mesh.zonohedron_zono"
+    bl_label = "Export ZONO"
+
+    filename_ext = ".zono"
+    filter_glob: bpy.props.StringProperty(default="*.zono", options={'HIDDEN'})
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj is not None and obj.type == 'MESH'
+
+    def execute(self, context):
+        try:
+            count = export_zono(context.active_object, self.filepath)
+        except (OSError, ValueError) as error:
+            self.report({'ERROR'}, str(error))
+            return {"CANCELLED"}
+        self.report({'INFO'}, "%d faces written" % count)
         return {"FINISHED"}
 
 def register():
     bpy.utils.register_class(MakeZonohedron)
+    bpy.utils.register_class(UpdateZonohedron)
+    bpy.utils.register_class(MakeZonohedronArray)
+    bpy.utils.register_class(MakeZonohedronHubs)
+    bpy.utils.register_class(ClassifyZonohedronPanels)
+    bpy.utils.register_class(TruncateZonohedron)
+    bpy.utils.register_class(AnalyzeZonohedronTruss)
+    bpy.utils.register_class(MakeZonohedronPanels)
+    bpy.utils.register_class(BakeZonohedronShapeKeys)
+    bpy.utils.register_class(SelectZonohedronZone)
+    bpy.utils.register_class(ColorZonohedronZones)
+    bpy.utils.register_class(CheckZonohedronPlanarity)
+    bpy.utils.register_class(ExportZonohedronFlatPack)
+    bpy.utils.register_class(ImportZonohedronZono)
+    bpy.utils.register_class(ExportZonohedronZono)
     bpy.utils.register_class(ZONO_PT_ZonohedronMaker)
+    bpy.app.handlers.save_pre.append(zonohedron_save_pre)
+    bpy.app.handlers.save_post.append(zonohedron_save_post)
+    if hasattr(bpy.app.handlers, "save_post_fail"):
+        bpy.app.handlers.save_post_fail.append(zonohedron_save_post)
+    bpy.app.handlers.load_post.append(zonohedron_load_post)
     bpy.types.Scene.zonohedron_type = bpy.props.EnumProperty(
         name="Type",
         description="Type of Zonohedron",
+        update=zonohedron_live_update,
         items=(('standard', 'Zonohedron', 'Standard Zonohedron'),
                ('spirallohedra', 'Spirallohedra', 'Rhombic Spirallohedra'),
                ('spiral', 'Spiral', 'Spiral Zonohedron'),
                ('curved', 'Curved', 'Curved Wireframe Zonohedron'),
+               ('generators', 'Generators', 'Zonohedron from Generator Vectors'),
                )
     )
+    bpy.types.Scene.zonohedron_generator_preset = bpy.props.EnumProperty(
+        name="Generators",
+        description="Generator vectors of the zonohedron",
+        items=(('rhombic_dodecahedron', 'Rhombic Dodecahedron', '4 body diagonals of the cube'),
+               ('truncated_octahedron', 'Truncated Octahedron', '6 face diagonals of the cube'),
+               ('rhombic_triacontahedron', 'Rhombic Triacontahedron', '6 five-fold axes of the icosahedron'),
+               ('rhombic_enneacontahedron', 'Rhombic Enneacontahedron', '10 three-fold axes of the icosahedron'),
+               ('custom', 'Custom', 'Vectors typed below or loaded from a CSV file'),
+               )
+    )
+    bpy.types.Scene.zonohedron_generator_text = bpy.props.StringProperty(
+        name="Vectors",
+        description="x,y,z vectors separated by ';', or the path of a CSV file with one vector per line",
+        default="1,0,0; 0,1,0; 0,0,1",
+    )
     bpy.types.Scene.zonohedron_sides = bpy.props.IntProperty(
         name="Sides",
         description="Number of Sides",
         min=3,
         max=60,
         default=12,
+        update=zonohedron_live_update,
     )
     bpy.types.Scene.zonohedron_width = bpy.props.IntProperty(
         name="Width",
         description="Width of Zonohedron",
         min=1,
         max=10,
-        default=1
+        default=1,
+        update=zonohedron_live_update,
     )
     bpy.types.Scene.zonohedron_detail = bpy.props.IntProperty(
         name="Detail",
         description="Size of Zonohedron",
         min=1,
         max=6,
-        default=1
+        default=1,
+        update=zonohedron_live_update,
+    )
+    bpy.types.Scene.zonohedron_adaptive = bpy.props.BoolProperty(
+        name="Adaptive Curves",
+        description="Sample curved arms by chord tolerance instead of detail",
+        default=0,
+        update=zonohedron_live_update,
+    )
+    bpy.types.Scene.zonohedron_curve_tolerance = bpy.props.FloatProperty(
+        name="Curve Tolerance",
+        description="Largest distance between a curved arm and its straight segments",
+        min=0.00001,
+        max=0.1,
+        default=0.001,
+        precision=5,
+        update=zonohedron_live_update,
     )
     bpy.types.Scene.zonohedron_spiral = bpy.props.IntProperty(
         name="Spiral Count",
         description="Spiral Count 0 = No Spiral",
         min=1,
         max=6,
-        default=1
+        default=1,
+        update=zonohedron_live_update,
     )
     bpy.types.Scene.zonohedron_reverse = bpy.props.BoolProperty(
         name="Reverse Spiral",
         description="Reverse Spiral Direction",
         default=0,
+        update=zonohedron_live_update,
+    )
+    bpy.types.Scene.zonohedron_live_update = bpy.props.BoolProperty(
+        name="Live",
+        description="Update the active zonohedron as the settings change",
+        default=0,
+    )
+    bpy.types.Scene.zonohedron_cache = bpy.props.BoolProperty(
+        name="Disk Cache",
+        description="Keep generated geometry on disk and reuse it across sessions",
+        default=0,
+    )
+    bpy.types.Scene.zonohedron_cache_size = bpy.props.IntProperty(
+        name="Cache Size (MB)",
+        description="Largest size of the disk cache, least recently used shapes are removed first",
+        min=1,
+        max=65536,
+        default=256
+    )
+    bpy.types.Scene.zonohedron_budget = bpy.props.IntProperty(
+        name="Budget (MB)",
+        description="Largest estimated mesh size a generation may reach",
+        min=1,
+        max=65536,
+        default=1024
+    )
+    bpy.types.Scene.zonohedron_budget_mode = bpy.props.EnumProperty(
+        name="Over Budget",
+        description="What to do when a generation is estimated over budget",
+        items=(('STOP', 'Warn and Stop', 'Report the estimate and build nothing'),
+               ('LOD', 'Coarser Detail', 'Lower detail, spirals, then sides until the estimate fits'),
+               )
+    )
+    bpy.types.Scene.zonohedron_render_ready = bpy.props.BoolProperty(
+        name="UVs and Normals",
+        description="Add per face UVs and flat custom normals to new zonohedra",
+        default=0,
+    )
+    bpy.types.Scene.zonohedron_uv_scale = bpy.props.FloatProperty(
+        name="UV Scale",
+        description="UV units per unit of face size",
+        min=0.001,
+        max=1000,
+        default=1
+    )
+    bpy.types.Scene.zonohedron_parametric = bpy.props.BoolProperty(
+        name="Save as Recipes",
+        description="Save zonohedra as their parameters only and regenerate them when the file is loaded",
+        default=0,
+    )
+    bpy.types.Scene.zonohedron_array_min = bpy.props.IntProperty(
+        name="Array Min Sides",
+        description="Fewest sides in the variant array",
+        min=3,
+        max=60,
+        default=6
+    )
+    bpy.types.Scene.zonohedron_array_max = bpy.props.IntProperty(
+        name="Array Max Sides",
+        description="Most sides in the variant array",
+        min=3,
+        max=60,
+        default=60
+    )
+    bpy.types.Scene.zonohedron_array_step = bpy.props.IntProperty(
+        name="Array Step",
+        description="Sides added between variants",
+        min=1,
+        max=30,
+        default=1
+    )
+    bpy.types.Scene.zonohedron_array_spacing = bpy.props.FloatProperty(
+        name="Array Spacing",
+        description="Distance between variants in zonohedron widths",
+        min=1,
+        max=10,
+        default=1.5
+    )
+    bpy.types.Scene.zonohedron_hub_radius = bpy.props.FloatProperty(
+        name="Hub Radius",
+        description="Radius of the connector stubs",
+        min=0.001,
+        max=1,
+        default=0.01
+    )
+    bpy.types.Scene.zonohedron_hub_length = bpy.props.FloatProperty(
+        name="Hub Length",
+        description="Length of the connector stubs",
+        min=0.001,
+        max=1,
+        default=0.05
+    )
+    bpy.types.Scene.zonohedron_panel_tolerance = bpy.props.FloatProperty(
+        name="Panel Tolerance",
+        description="Length tolerance when matching congruent panels",
+        min=0.00001,
+        max=0.1,
+        default=0.001,
+        precision=5
+    )
+    bpy.types.Scene.zonohedron_panel_instances = bpy.props.BoolProperty(
+        name="Panel Instances",
+        description="Rebuild the solid from one shared mesh per panel type",
+        default=0,
+    )
+    bpy.types.Scene.zonohedron_bake_mode = bpy.props.EnumProperty(
+        name="Animation",
+        items=(('EXTRUDE', 'Spiral Extrusion', 'Arms grow chord by chord out of the lowest vertex'),
+               ('UNFOLD', 'Unfold', 'Struts keep their length and lift from a flat disc'),
+               ('DETAIL', 'Detail Morph', 'Standard zonohedron morphs into the spirallohedron of its recipe'),
+               )
+    )
+    bpy.types.Scene.zonohedron_bake_frames = bpy.props.IntProperty(
+        name="Frames",
+        description="Shape keys to bake, one per frame from the scene start",
+        min=2,
+        max=10000,
+        default=250
+    )
+    bpy.types.Scene.zonohedron_bake_start = bpy.props.FloatProperty(
+        name="Start",
+        description="Where the ramp starts, 0 from nothing, flat or standard, 1 the finished shape",
+        subtype='FACTOR',
+        min=0,
+        max=1,
+        default=0
+    )
+    bpy.types.Scene.zonohedron_panel_thickness = bpy.props.FloatProperty(
+        name="Panel Thickness",
+        description="Thickness of each panel solid, set in from the surface",
+        min=0.00001,
+        default=0.01,
+        precision=4
+    )
+    bpy.types.Scene.zonohedron_truncate_height = bpy.props.FloatProperty(
+        name="Cut Height",
+        description="Height of the cutting plane as a fraction of the object's height",
+        subtype='FACTOR',
+        min=0,
+        max=1,
+        default=0.5
+    )
+    bpy.types.Scene.zonohedron_truncate_keep = bpy.props.EnumProperty(
+        name="Keep",
+        items=(('ABOVE', 'Above', 'Keep the part above the plane, as for a dome'),
+               ('BELOW', 'Below', 'Keep the part below the plane'),
+               )
+    )
+    bpy.types.Scene.zonohedron_truncate_cap = bpy.props.BoolProperty(
+        name="Cap Opening",
+        description="Close the cut with a base polygon",
+        default=1,
+    )
+    bpy.types.Scene.zonohedron_truss_modulus = bpy.props.FloatProperty(
+        name="Modulus (GPa)",
+        description="Young's modulus of the strut material",
+        min=0.001,
+        default=200
+    )
+    bpy.types.Scene.zonohedron_truss_diameter = bpy.props.FloatProperty(
+        name="Tube Diameter (mm)",
+        description="Outer diameter of struts in groups without a section, a strut_area edge attribute overrides it",
+        min=0.1,
+        default=25
+    )
+    bpy.types.Scene.zonohedron_truss_wall = bpy.props.FloatProperty(
+        name="Tube Wall (mm)",
+        min=0.01,
+        default=2
+    )
+    bpy.types.Scene.zonohedron_truss_density = bpy.props.FloatProperty(
+        name="Density (kg/m³)",
+        description="Strut density for the self weight",
+        min=0,
+        default=7850
+    )
+    bpy.types.Scene.zonohedron_truss_point_load = bpy.props.FloatProperty(
+        name="Point Load (N)",
+        description="Downward load on every selected vertex",
+        min=0,
+        default=0
+    )
+    bpy.types.Scene.zonohedron_truss_support_band = bpy.props.FloatProperty(
+        name="Support Band",
+        description="Vertices up to this height above the lowest one are pinned",
+        min=0,
+        default=0.01,
+        precision=4
+    )
+    bpy.types.Scene.zonohedron_truss_sections = bpy.props.StringProperty(
+        name="Sections",
+        description="group, diameter, wall in mm separated by ';', or the path of a CSV file with one strut group per line. "
+                    "Groups are numbered by strut length, shortest first, as in the strut_group attribute",
+        default="",
+    )
+    bpy.types.Scene.zonohedron_zone_attribute = bpy.props.EnumProperty(
+        name="Zone",
+        description="Face attribute recorded at generation that groups the faces",
+        items=(('zone_arm', 'Arm', 'Copy around the axis, or the zone of a generator'),
+               ('zone_band', 'Band', 'Rib or leaf along the arm'),
+               ('zone_segment', 'Segment', 'Detail strip, or spiral piece from the top shell down'),
+               )
+    )
+    bpy.types.Scene.zonohedron_zone_value = bpy.props.IntProperty(
+        name="Zone Index",
+        description="Zone to select, -1 for the zone of the active face",
+        min=-1,
+        default=-1
+    )
+    bpy.types.Scene.zonohedron_zone_extend = bpy.props.BoolProperty(
+        name="Extend Selection",
+        description="Add the zone to the current selection",
+        default=0,
+    )
+    bpy.types.Scene.zonohedron_planarity_tolerance = bpy.props.FloatProperty(
+        name="Planarity Tolerance",
+        description="Largest distance of a face corner from the face's best fit plane",
+        min=0.0,
+        max=0.1,
+        default=0.0001,
+        precision=6
+    )
+    bpy.types.Scene.zonohedron_triangulate = bpy.props.BoolProperty(
+        name="Triangulate Warped Faces",
+        description="Split faces over the planarity tolerance along their shorter diagonal",
+        default=0,
     )
 
 def unregister():
     bpy.utils.unregister_class(MakeZonohedron)
+    bpy.utils.unregister_class(UpdateZonohedron)
+    bpy.utils.unregister_class(MakeZonohedronArray)
+    bpy.utils.unregister_class(MakeZonohedronHubs)
+    bpy.utils.unregister_class(ClassifyZonohedronPanels)
+    bpy.utils.unregister_class(TruncateZonohedron)
+    bpy.utils.unregister_class(AnalyzeZonohedronTruss)
+    bpy.utils.unregister_class(MakeZonohedronPanels)
+    bpy.utils.unregister_class(BakeZonohedronShapeKeys)
+    bpy.utils.unregister_class(SelectZonohedronZone)
+    bpy.utils.unregister_class(ColorZonohedronZones)
+    bpy.utils.unregister_class(CheckZonohedronPlanarity)
+    bpy.utils.unregister_class(ExportZonohedronFlatPack)
+    bpy.utils.unregister_class(ImportZonohedronZono)
+    bpy.utils.unregister_class(ExportZonohedronZono)
     bpy.utils.unregister_class(ZONO_PT_ZonohedronMaker)
+    bpy.app.handlers.save_pre.remove(zonohedron_save_pre)
+    bpy.app.handlers.save_post.remove(zonohedron_save_post)
+    if hasattr(bpy.app.handlers, "save_post_fail"):
+        bpy.app.handlers.save_post_fail.remove(zonohedron_save_post)
+    bpy.app.handlers.load_post.remove(zonohedron_load_post)
     del bpy.types.Scene.zonohedron_type
+    del bpy.types.Scene.zonohedron_generator_preset
+    del bpy.types.Scene.zonohedron_generator_text
     del bpy.types.Scene.zonohedron_sides
     del bpy.types.Scene.zonohedron_width
     del bpy.types.Scene.zonohedron_detail
+    del bpy.types.Scene.zonohedron_adaptive
+    del bpy.types.Scene.zonohedron_curve_tolerance
     del bpy.types.Scene.zonohedron_spiral
     del bpy.types.Scene.zonohedron_reverse
+    del bpy.types.Scene.zonohedron_live_update
+    del bpy.types.Scene.zonohedron_cache
+    del bpy.types.Scene.zonohedron_cache_size
+    del bpy.types.Scene.zonohedron_budget
+    del bpy.types.Scene.zonohedron_budget_mode
+    del bpy.types.Scene.zonohedron_render_ready
+    del bpy.types.Scene.zonohedron_uv_scale
+    del bpy.types.Scene.zonohedron_parametric
+    del bpy.types.Scene.zonohedron_array_min
+    del bpy.types.Scene.zonohedron_array_max
+    del bpy.types.Scene.zonohedron_array_step
+    del bpy.types.Scene.zonohedron_array_spacing
+    del bpy.types.Scene.zonohedron_hub_radius
+    del bpy.types.Scene.zonohedron_hub_length
+    del bpy.types.Scene.zonohedron_panel_tolerance
+    del bpy.types.Scene.zonohedron_panel_instances
+    del bpy.types.Scene.zonohedron_bake_mode
+    del bpy.types.Scene.zonohedron_bake_frames
+    del bpy.types.Scene.zonohedron_bake_start
+    del bpy.types.Scene.zonohedron_panel_thickness
+    del bpy.types.Scene.zonohedron_truncate_height
+    del bpy.types.Scene.zonohedron_truncate_keep
+    del bpy.types.Scene.zonohedron_truncate_cap
+    del bpy.types.Scene.zonohedron_truss_modulus
+    del bpy.types.Scene.zonohedron_truss_diameter
+    del bpy.types.Scene.zonohedron_truss_wall
+    del bpy.types.Scene.zonohedron_truss_density
+    del bpy.types.Scene.zonohedron_truss_point_load
+    del bpy.types.Scene.zonohedron_truss_support_band
+    del bpy.types.Scene.zonohedron_truss_sections
+    del bpy.types.Scene.zonohedron_zone_attribute
+    del bpy.types.Scene.zonohedron_zone_value
+    del bpy.types.Scene.zonohedron_zone_extend
+    del bpy.types.Scene.zonohedron_planarity_tolerance
+    del bpy.types.Scene.zonohedron_triangulate
 
 # Interface end ------------------------------
 
 if __name__ == "__main__":
-    try:
-        unregister()
-    except Exception:
-        pass
-    register()
+    if "--" in sys.argv:
+        cli_main(sys.argv[sys.argv.index("--") + 1:])
+    else:
+        try:
+            unregister()
+        except Exception:
+            pass
+        register()